@@ -1,6 +1,6 @@
 """Configuration module for AIRecruiter v2 API."""
 
-from .settings import settings
+from .settings import Settings, settings, get_settings
 from .database import get_db, engine, SessionLocal
 
-__all__ = ["settings", "get_db", "engine", "SessionLocal"]
+__all__ = ["Settings", "settings", "get_settings", "get_db", "engine", "SessionLocal"]
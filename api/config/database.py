@@ -2,11 +2,13 @@
 
 from typing import Generator
 
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from .settings import settings
 
+__all__ = ["engine", "SessionLocal", "Base", "get_db", "init_db", "check_db_connection"]
+
 # Build connection URL with MARS enabled
 # MARS (Multiple Active Result Sets) allows multiple queries on the same connection
 database_url = settings.DATABASE_URL
@@ -16,14 +18,20 @@ if "MARS_Connection" not in database_url:
 
 # Create engine for SQL Server
 # Note: We use sync engine since aioodbc is not well-maintained
-# FastAPI can handle sync database operations via thread pool
+# FastAPI runs `def` endpoints in its thread pool, so DB-bound endpoints
+# should be declared `def` rather than `async def` (see ADR 002)
 engine = create_engine(
     database_url,
     echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    pool_recycle=3600,
+    # Recycle connections before SQL Server / load balancers drop them idle,
+    # instead of pinging on every checkout. A connection that still dies is
+    # detected as a disconnect and the pool is invalidated and refilled.
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
 )
 
 # Session factory
@@ -33,20 +41,32 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
-# Base class for models
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Base class for models (SQLAlchemy 2.0 declarative style)."""
+
+
+# Connectivity probe, built once so health checks reuse the compiled statement
+_PING_STMT = text("SELECT 1")
 
 
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency that provides a database session.
 
+    FastAPI caches dependency results per request, so every dependency and
+    sub-dependency that asks for get_db in one request shares this session
+    (and at most one pooled connection, checked out on first query).
+
     Usage:
         @router.get("/items")
         def get_items(db: Session = Depends(get_db)):
             return db.query(Item).all()
     """
-    db = SessionLocal()
+    # Request sessions are short-lived, so objects don't need reloading after
+    # commit; handlers can read e.g. new IDs without another SELECT. Long-lived
+    # sessions (the interview websocket) keep the default expire-on-commit.
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
@@ -65,7 +85,7 @@ def check_db_connection() -> bool:
     """Check if database connection is working."""
     try:
         with engine.connect() as conn:
-            conn.execute("SELECT 1")
+            conn.execute(_PING_STMT)
         return True
     except Exception:
         return False
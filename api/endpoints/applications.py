@@ -1,27 +1,36 @@
 """Application endpoints with Human-in-the-Loop decision actions."""
 
-import json
+import base64
+import os
+import re
 import secrets
+import threading
 from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from typing import Optional, List
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, HTTPException, Response
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, cast, exists, func, insert, literal_column, or_, select, update
+from sqlalchemy.orm import Session, defer, raiseload
 
 from api.config.database import get_db
 from api.config.settings import settings
-from api.services.s3 import S3Service
+from api.services.s3 import get_s3_service
 from api.middleware.error_handler import NotFoundError
-from api.models import Application, Requisition, Analysis, Interview, Report, Job, ApplicationDecision, Activity, Setting, RejectionReason, Message
+from api.models import Application, Requisition, Recruiter, Analysis, Interview, Report, Job, ApplicationDecision, Message
+from api.models.types import json_dumps
 from api.schemas.applications import (
     ApplicationListItem,
     ApplicationResponse,
     AnalysisResponse,
     ReprocessRequest,
     ReprocessResponse,
+    BulkReprocessRequest,
+    BulkReprocessResponse,
     AdvanceRequest,
     RejectRequest,
     HoldRequest,
@@ -39,24 +48,42 @@ from api.schemas.interviews import (
     StartProxyInterviewResponse,
     MessageResponse,
 )
-from api.schemas.base import PaginatedResponse, PaginationMeta
-from api.services.rbac import require_role
+from api.schemas.base import PaginatedResponse, json_response
+from api.endpoints.settings import get_setting_value
+from api.endpoints.workday_config import get_active_reason_external_ids
+from api.services.rbac import require_recruiter
+from api.services.activity import write_activity
+from api.services.cache import TTLCache
 from api.services.email_preview import generate_interview_email_preview
+from api.services.interview_invites import send_interview_invite
 from api.services.interview_service import InterviewService
 
 logger = structlog.get_logger()
 router = APIRouter()
 
 
-def get_setting_value(db: Session, key: str, default: str = "") -> str:
-    """Get a setting value from the database."""
-    setting = db.query(Setting).filter(Setting.key == key).first()
-    return setting.value if setting else default
+# Reprocess step -> job type (read-only, shared by every request)
+STEP_TO_JOB = MappingProxyType({
+    "analyze": "analyze",
+    "send_interview": "send_interview",
+    "evaluate": "evaluate",
+    "generate_report": "generate_report",
+})
+
+# Loader options for single-application fetches that only read columns.
+# In DEBUG, any relationship access on the row raises instead of silently
+# issuing a lazy SELECT, so new N+1s surface in development.
+APPLICATION_DETAIL_OPTS = (raiseload("*"),) if settings.DEBUG else ()
 
 # Valid statuses for human decisions
-ADVANCE_VALID_STATUSES = {"ready_for_review", "interview_ready_for_review", "on_hold"}
-REJECT_VALID_STATUSES = {"ready_for_review", "interview_ready_for_review", "on_hold", "new", "extracted"}
-HOLD_VALID_STATUSES = {"ready_for_review", "interview_ready_for_review"}
+ADVANCE_VALID_STATUSES = frozenset({"ready_for_review", "interview_ready_for_review", "on_hold"})
+REJECT_VALID_STATUSES = frozenset({"ready_for_review", "interview_ready_for_review", "on_hold", "new", "extracted"})
+HOLD_VALID_STATUSES = frozenset({"ready_for_review", "interview_ready_for_review"})
+
+# Readable forms for the invalid-transition error messages
+ADVANCE_VALID_LABEL = ", ".join(sorted(ADVANCE_VALID_STATUSES))
+REJECT_VALID_LABEL = ", ".join(sorted(REJECT_VALID_STATUSES))
+HOLD_VALID_LABEL = ", ".join(sorted(HOLD_VALID_STATUSES))
 
 
 # Valid sort columns for server-side sorting
@@ -72,9 +99,184 @@ SORTABLE_COLUMNS = {
     "currentTitle": Application.current_title,
 }
 
+# List row label holding each sort's value, for building the next cursor
+# (None is the default newest-first sort)
+_SORT_ROW_KEYS = {key: column.key for key, column in SORTABLE_COLUMNS.items()} | {
+    None: "created_at",
+    "requisitionName": "requisition_name",
+}
+
+# Per-row existence flags, evaluated inline with the page query so the list
+# endpoint doesn't need a follow-up IN (...) query per related table.
+# SQL Server can't select a bare EXISTS, so wrap each in a CASE.
+HAS_ANALYSIS = case(
+    (exists().where(Analysis.application_id == Application.id), True), else_=False
+).label("has_analysis")
+HAS_INTERVIEW = case(
+    (exists().where(Interview.application_id == Application.id), True), else_=False
+).label("has_interview")
+HAS_REPORT = case(
+    (exists().where(Report.application_id == Application.id), True), else_=False
+).label("has_report")
+
+# Columns selected for the list page. Labels match ApplicationListItem fields,
+# so large text columns (artifacts, external_data) are never fetched.
+LIST_COLUMNS = (
+    Application.id,
+    Application.requisition_id,
+    Requisition.name.label("requisition_name"),
+    Application.external_application_id,
+    Application.candidate_name,
+    Application.candidate_email,
+    Application.status,
+    Application.workday_status,
+    HAS_ANALYSIS,
+    HAS_INTERVIEW,
+    HAS_REPORT,
+    # Denormalized sort columns (populated by extract_facts processor)
+    Application.jd_match_percentage,
+    Application.avg_tenure_months,
+    Application.current_title,
+    Application.current_employer,
+    Application.total_experience_months,
+    Application.months_since_last_employment,
+    Application.compliance_review,
+    Application.rejection_reason_code,
+    Application.created_at,
+)
+
+# (column label, JSON key, coerce None -> False) for each list item field,
+# mirroring ApplicationListItem's camelCase aliases and bool validator.
+# Rows are emitted as plain dicts instead of building a model per row.
+_LIST_BOOL_FIELDS = frozenset({"has_analysis", "has_interview", "has_report", "compliance_review"})
+_LIST_ITEM_FIELDS = tuple(
+    (name, field.alias or name, name in _LIST_BOOL_FIELDS)
+    for name, field in ApplicationListItem.model_fields.items()
+)
+
+# Word tokens for full-text candidate name search
+_SEARCH_WORD_RE = re.compile(r"\w+")
+
+# Base statements for the list endpoint, built once at import. Selecting only
+# the list columns brings back the requisition name and related-record flags
+# in the same round trip; COUNT(*) OVER() is evaluated before OFFSET/FETCH, so
+# every row also carries the filtered total and no separate COUNT is needed.
+_LIST_STMT = select(*LIST_COLUMNS, func.count().over().label("total")).join_from(
+    Application, Requisition
+)
+_COUNT_STMT = select(func.count()).select_from(Application).join(Requisition)
+
+# Rows fetched per batch when streaming a list page
+LIST_YIELD_PER = 25
+
+
+def _encode_cursor(sort_key: Optional[str], value, application_id: int) -> str:
+    """Encode the last row of a page (sort value, id) as an opaque keyset cursor."""
+    raw = orjson.dumps([sort_key, value, application_id])
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+# JSON types a cursor value may have, by the sort column's Python type
+# (datetimes travel as ISO strings)
+_CURSOR_VALUE_TYPES = {str: (str,), int: (int,), float: (int, float), datetime: (str,)}
+
+
+def _decode_cursor(cursor: str, sort_key: Optional[str], column) -> tuple:
+    """
+    Decode a keyset cursor into (sort value, id).
+
+    The cursor must have been issued for the same sort, and its value must
+    fit the sort column's type; anything else is a 400 rather than a
+    failed query.
+    """
+    try:
+        cursor_sort_key, value, application_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if cursor_sort_key != sort_key:
+            raise ValueError("cursor was issued for a different sort")
+        python_type = column.type.python_type
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, _CURSOR_VALUE_TYPES[python_type])
+        ):
+            raise TypeError("cursor value does not match the sort column")
+        if isinstance(application_id, bool) or not isinstance(application_id, int):
+            raise TypeError("cursor id is not an integer")
+        if value is not None and python_type is datetime:
+            value = datetime.fromisoformat(value)
+        return value, application_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _keyset_after(column, descending: bool, value, application_id: int):
+    """
+    Predicate for rows after (value, id) in ORDER BY column, id DESC.
+
+    SQL Server has no row-value comparison, so the tuple comparison is
+    expanded by hand. NULLs sort first ascending and last descending there,
+    so they get their own branch.
+    """
+    id_after = Application.id < application_id
+    if value is None:
+        null_rest = and_(column.is_(None), id_after)
+        return null_rest if descending else or_(null_rest, column.isnot(None))
+    if column.type.python_type is datetime:
+        # pyodbc binds datetimes as datetime2, and comparing that against a
+        # DATETIME column (1/300s ticks) widens the column, so the row the
+        # cursor came from no longer compares equal. Round the bound value
+        # to the column's own type instead.
+        value = cast(value, column.type)
+    beyond = column < value if descending else column > value
+    after = or_(beyond, and_(column == value, id_after))
+    return or_(after, column.is_(None)) if descending else after
+
+
+# Interview tokens carry 32 random bytes (same as secrets.token_urlsafe(32)).
+# Random bytes are drawn from the OS CSPRNG in blocks and handed out in
+# slices, so a token costs one urandom call per block instead of per token.
+INTERVIEW_TOKEN_BYTES = 32
+_TOKEN_BLOCK_TOKENS = 256
+_token_buffer = bytearray()
+_token_lock = threading.Lock()
+
+
+def _reset_token_buffer() -> None:
+    # A forked worker must never hand out bytes its parent (or a sibling)
+    # could also hand out
+    global _token_lock
+    _token_buffer.clear()
+    _token_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_token_buffer)
+
+
+def _new_interview_token() -> str:
+    """Generate a URL-safe interview token from the buffered random bytes."""
+    with _token_lock:
+        if len(_token_buffer) < INTERVIEW_TOKEN_BYTES:
+            _token_buffer.extend(secrets.token_bytes(INTERVIEW_TOKEN_BYTES * _TOKEN_BLOCK_TOKENS))
+        raw = bytes(_token_buffer[:INTERVIEW_TOKEN_BYTES])
+        del _token_buffer[:INTERVIEW_TOKEN_BYTES]
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _fulltext_prefix_query(search: str) -> Optional[str]:
+    """Build a CONTAINS() search condition matching every word as a prefix.
+
+    "jo smi" -> '"jo*" AND "smi*"'. Returns None when the search has no
+    word characters, so the caller can fall back to LIKE.
+
+    Unlike LIKE '%term%', this only matches the start of a word: "smi"
+    finds "Smith" but not "Goldsmith".
+    """
+    words = _SEARCH_WORD_RE.findall(search)
+    if not words:
+        return None
+    return " AND ".join(f'"{word}*"' for word in words)
+
 
 @router.get("", response_model=PaginatedResponse[ApplicationListItem])
-async def list_applications(
+def list_applications(
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
@@ -86,128 +288,120 @@ async def list_applications(
     date_to: Optional[str] = Query(None),
     sort_by: Optional[str] = Query(None, description="Column to sort by"),
     sort_order: Optional[str] = Query("desc", regex="^(asc|desc)$", description="Sort order: asc or desc"),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.nextCursor"),
+    user: dict = Depends(require_recruiter),
 ):
-    """List all applications with pagination and server-side sorting."""
-    query = db.query(Application).join(Requisition)
+    """List all applications with pagination and server-side sorting.
 
+    Pages are addressed by `page` (OFFSET) or by `cursor`, which seeks past
+    the previous page's last row so deep pages cost the same as the first.
+    A cursor is only valid with the sort it was issued for.
+    """
     # Filters
+    filters = []
     if requisition_id:
-        query = query.filter(Application.requisition_id == requisition_id)
+        filters.append(Application.requisition_id == requisition_id)
     if status:
-        query = query.filter(Application.status == status)
+        filters.append(Application.status == status)
     if exclude_statuses:
         excluded = [s.strip() for s in exclude_statuses.split(",") if s.strip()]
         if excluded:
-            query = query.filter(~Application.status.in_(excluded))
+            filters.append(~Application.status.in_(excluded))
     if search:
-        # Escape SQL wildcards to prevent unexpected search behavior
-        escaped_search = search.replace("%", r"\%").replace("_", r"\_")
-        query = query.filter(Application.candidate_name.ilike(f"%{escaped_search}%", escape="\\"))
-
-    # Count total
-    total = query.count()
+        fulltext_query = _fulltext_prefix_query(search) if settings.SEARCH_USE_FULLTEXT else None
+        if fulltext_query:
+            # Full-text index seek instead of a LIKE table scan
+            filters.append(func.contains(Application.candidate_name, fulltext_query))
+        else:
+            # Escape SQL wildcards to prevent unexpected search behavior
+            escaped_search = search.replace("%", r"\%").replace("_", r"\_")
+            filters.append(Application.candidate_name.ilike(f"%{escaped_search}%", escape="\\"))
 
     # Server-side sorting
     if sort_by and sort_by in SORTABLE_COLUMNS:
+        sort_key = sort_by
         sort_column = SORTABLE_COLUMNS[sort_by]
-        if sort_order == "asc":
-            query = query.order_by(sort_column.asc())
-        else:
-            query = query.order_by(sort_column.desc())
+        descending = sort_order != "asc"
     else:
         # Default sort: newest first
-        query = query.order_by(Application.created_at.desc())
-
-    # Paginate
-    applications = query.offset((page - 1) * per_page).limit(per_page).all()
-
-    # Get related data
-    app_ids = [a.id for a in applications]
-
-    # Check for analysis
-    analysis_app_ids = set(
-        row[0]
-        for row in db.query(Analysis.application_id)
-        .filter(Analysis.application_id.in_(app_ids))
-        .all()
-    )
-
-    # Check for interviews
-    interview_app_ids = set(
-        row[0]
-        for row in db.query(Interview.application_id)
-        .filter(Interview.application_id.in_(app_ids))
-        .all()
-    )
-
-    # Check for reports
-    report_app_ids = set(
-        row[0]
-        for row in db.query(Report.application_id)
-        .filter(Report.application_id.in_(app_ids))
-        .all()
-    )
+        sort_key = None
+        sort_column = Application.created_at
+        descending = True
+    order = sort_column.desc() if descending else sort_column.asc()
+
+    # Keyset position
+    keyset = []
+    if cursor:
+        after_value, after_id = _decode_cursor(cursor, sort_key, sort_column)
+        keyset.append(_keyset_after(sort_column, descending, after_value, after_id))
+
+    # Paginate on top of the shared base statement. Filter values, offset and
+    # limit are all bound parameters, so each filter combination compiles once
+    # and later requests hit the engine's compiled cache. id breaks ties so
+    # page boundaries are stable.
+    stmt = _LIST_STMT.where(*filters, *keyset).order_by(order, Application.id.desc())
+    if keyset:
+        stmt = stmt.limit(per_page)
+    else:
+        stmt = stmt.offset((page - 1) * per_page).limit(per_page)
+    # Stream rows in batches and build items as they arrive, so a 100-row
+    # page never holds the full raw result and the item dicts at once.
+    # The extra "total" column is not copied into the items.
+    items = []
+    total = None
+    last = None
+    for row in db.execute(stmt.execution_options(yield_per=LIST_YIELD_PER)):
+        last = row._mapping
+        if total is None:
+            total = last["total"]
+        items.append({
+            key: bool(last[name]) if is_bool else last[name]
+            for name, key, is_bool in _LIST_ITEM_FIELDS
+        })
+
+    if keyset or (total is None and page > 1):
+        # The window count only covers rows after the cursor, and a page past
+        # the end returns no rows to carry it
+        total = db.scalar(_COUNT_STMT.where(*filters))
+    elif total is None:
+        total = 0
+
+    next_cursor = None
+    if len(items) == per_page:
+        next_cursor = _encode_cursor(sort_key, last[_SORT_ROW_KEYS.get(sort_key, sort_key)], last["id"])
 
     # Note: Sort columns (jd_match_percentage, total_experience_months, avg_tenure_months,
     # current_title, current_employer, months_since_last_employment) are now denormalized
     # directly on the applications table for efficient sorting. No JSON parsing needed.
 
-    items = [
-        ApplicationListItem(
-            id=a.id,
-            requisition_id=a.requisition_id,
-            requisition_name=a.requisition.name,
-            external_application_id=a.external_application_id,
-            candidate_name=a.candidate_name,
-            candidate_email=a.candidate_email,
-            status=a.status,
-            workday_status=a.workday_status,
-            has_analysis=a.id in analysis_app_ids,
-            has_interview=a.id in interview_app_ids,
-            has_report=a.id in report_app_ids,
-            # Denormalized sort columns (populated by extract_facts processor)
-            jd_match_percentage=a.jd_match_percentage,
-            avg_tenure_months=a.avg_tenure_months,
-            current_title=a.current_title,
-            current_employer=a.current_employer,
-            total_experience_months=a.total_experience_months,
-            months_since_last_employment=a.months_since_last_employment,
-            compliance_review=a.compliance_review,
-            rejection_reason_code=a.rejection_reason_code,
-            created_at=a.created_at,
-        )
-        for a in applications
-    ]
-
-    return PaginatedResponse(
-        data=items,
-        meta=PaginationMeta(
-            page=page,
-            per_page=per_page,
-            total=total,
-            total_pages=(total + per_page - 1) // per_page,
-        ),
+    # The page is already in its JSON shape; serialize it directly rather than
+    # going through PaginatedResponse. response_model still documents it.
+    return Response(
+        orjson.dumps({
+            "data": items,
+            "meta": {
+                "page": page,
+                "perPage": per_page,
+                "total": total,
+                "totalPages": (total + per_page - 1) // per_page,
+                "nextCursor": next_cursor,
+            },
+        }),
+        media_type="application/json",
     )
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
-async def get_application(
+def get_application(
     application_id: int,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Get an application by ID."""
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = db.get(Application, application_id, options=APPLICATION_DETAIL_OPTS)
     if not application:
         raise NotFoundError("Application", application_id)
 
-    # Safely parse artifacts JSON
-    try:
-        artifacts = json.loads(application.artifacts) if application.artifacts else {}
-    except (json.JSONDecodeError, TypeError):
-        artifacts = {}
-
     return ApplicationResponse(
         id=application.id,
         requisition_id=application.requisition_id,
@@ -219,128 +413,218 @@ async def get_application(
         workday_status=application.workday_status,
         workday_status_changed=application.workday_status_changed,
         compliance_review=application.compliance_review,
-        artifacts=artifacts,
+        artifacts=application.artifacts or {},
         created_at=application.created_at,
         updated_at=application.updated_at,
         processed_at=application.processed_at,
     )
 
 
+def _load_analysis(db: Session, application_id: int) -> Analysis:
+    """
+    Fetch an application's analysis, checking the application exists in the
+    same round trip (outer join), so each case still gets its own 404.
+
+    The raw AI response and resume text are never returned by these
+    endpoints, so they're left unloaded.
+    """
+    row = db.execute(
+        select(Application.id, Analysis)
+        .outerjoin(Analysis, Analysis.application_id == Application.id)
+        .where(Application.id == application_id)
+        .options(defer(Analysis.raw_response), defer(Analysis.raw_resume_text))
+    ).first()
+    if row is None:
+        raise NotFoundError("Application", application_id)
+    if row.Analysis is None:
+        raise NotFoundError("Analysis", application_id)
+    return row.Analysis
+
+
 @router.get("/{application_id}/analysis", response_model=AnalysisResponse)
-async def get_application_analysis(
+def get_application_analysis(
     application_id: int,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Get analysis for an application."""
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise NotFoundError("Application", application_id)
-
-    analysis = db.query(Analysis).filter(Analysis.application_id == application_id).first()
-    if not analysis:
-        raise NotFoundError("Analysis", application_id)
-
-    # Safely parse JSON fields
-    def safe_json_loads(data, default=None):
-        if not data:
-            return default if default is not None else []
-        try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
-            return default if default is not None else []
+    analysis = _load_analysis(db, application_id)
 
     return AnalysisResponse(
         id=analysis.id,
         application_id=analysis.application_id,
         extraction_version=analysis.extraction_version,
         extraction_notes=analysis.extraction_notes,
-        extracted_facts=safe_json_loads(analysis.extracted_facts, {}),
+        extracted_facts=analysis.extracted_facts or {},
         relevance_summary=analysis.relevance_summary,
-        pros=safe_json_loads(analysis.pros),
-        cons=safe_json_loads(analysis.cons),
-        suggested_questions=safe_json_loads(analysis.suggested_questions),
-        compliance_flags=safe_json_loads(analysis.compliance_flags),
+        pros=analysis.pros or [],
+        cons=analysis.cons or [],
+        suggested_questions=analysis.suggested_questions or [],
+        compliance_flags=analysis.compliance_flags or [],
         model_version=analysis.model_version,
         created_at=analysis.created_at,
     )
 
 
+@router.post("/reprocess-bulk", response_model=BulkReprocessResponse)
+def reprocess_applications_bulk(
+    data: BulkReprocessRequest,
+    db: Session = Depends(get_db),
+    user: dict = Depends(require_recruiter),
+):
+    """Reprocess several applications from a specific step.
+
+    All jobs are inserted in a single statement; unknown IDs are skipped
+    and reported back.
+    """
+    found_ids = set(
+        db.scalars(select(Application.id).where(Application.id.in_(data.application_ids)))
+    )
+    app_ids = [aid for aid in data.application_ids if aid in found_ids]
+    not_found_ids = [aid for aid in data.application_ids if aid not in found_ids]
+
+    job_type = STEP_TO_JOB.get(data.from_step, "analyze")
+
+    job_ids = []
+    if app_ids:
+        job_ids = list(db.scalars(
+            insert(Job).returning(Job.id),
+            [
+                # Medium priority for reprocess
+                {"application_id": aid, "job_type": job_type, "priority": 5}
+                for aid in app_ids
+            ],
+        ))
+        db.commit()
+
+    logger.info(
+        "Bulk reprocess triggered",
+        from_step=data.from_step,
+        queued=len(job_ids),
+        not_found=len(not_found_ids),
+    )
+
+    return BulkReprocessResponse(
+        status="queued" if job_ids else "not_found",
+        queue_item_ids=job_ids,
+        not_found_ids=not_found_ids,
+        message=f"{len(job_ids)} reprocess job(s) queued from step '{data.from_step}'",
+    )
+
+
 @router.post("/{application_id}/reprocess", response_model=ReprocessResponse)
-async def reprocess_application(
+def reprocess_application(
     application_id: int,
     data: ReprocessRequest,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Reprocess an application from a specific step."""
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = db.get(Application, application_id, options=APPLICATION_DETAIL_OPTS)
     if not application:
         raise NotFoundError("Application", application_id)
 
-    # Map step to job type
-    step_to_job = {
-        "analyze": "analyze",
-        "send_interview": "send_interview",
-        "evaluate": "evaluate",
-        "generate_report": "generate_report",
-    }
-
-    job_type = step_to_job.get(data.from_step, "analyze")
+    job_type = STEP_TO_JOB.get(data.from_step, "analyze")
 
-    # Create job
+    # Create job; the flush fetches the new ID, so no refresh is needed
     job = Job(
         application_id=application_id,
         job_type=job_type,
         priority=5,  # Medium priority for reprocess
     )
     db.add(job)
+    db.flush()
+    job_id = job.id
     db.commit()
-    db.refresh(job)
 
     logger.info(
         "Reprocess triggered",
         application_id=application_id,
         from_step=data.from_step,
-        job_id=job.id,
+        job_id=job_id,
     )
 
     return ReprocessResponse(
         status="queued",
-        queue_item_id=job.id,
+        queue_item_id=job_id,
         message=f"Reprocess job queued from step '{data.from_step}'",
     )
 
 
 # Human-in-the-Loop Decision Endpoints
 
+# Pre-update status of a row changed by a conditional UPDATE
+# (SQL Server OUTPUT deleted.status)
+_FROM_STATUS = literal_column("deleted.status").label("from_status")
+
+
+def _raise_invalid_transition(db: Session, application_id: int, action: str, valid_label: str) -> None:
+    """Raise the right error after a conditional status UPDATE matched no row."""
+    current_status = db.scalar(select(Application.status).where(Application.id == application_id))
+    if current_status is None:
+        raise NotFoundError("Application", application_id)
+    raise HTTPException(
+        status_code=400,
+        detail=f"Cannot {action} application with status '{current_status}'. Valid statuses: {valid_label}",
+    )
+
+
+# Responses to decision POSTs sent with an Idempotency-Key header, so a
+# repeated click returns the first result instead of a 400. Per worker;
+# a retry that lands on another worker falls through to the status check.
+_decision_responses = TTLCache(ttl=60, maxsize=10_000)
+
+
+def _decision_cache_key(idempotency_key: Optional[str], user_id, action: str, application_id: int):
+    """Cache key for an idempotent decision, or None when no key was sent."""
+    if not idempotency_key:
+        return None
+    return (idempotency_key, user_id, action, application_id)
+
+
 @router.post("/{application_id}/advance", response_model=DecisionResponse)
-async def advance_application(
+def advance_application(
     application_id: int,
     data: AdvanceRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
+    idempotency_key: Optional[str] = Header(None),
 ):
     """Advance an application to the next stage.
 
     Valid from: ready_for_review, interview_ready_for_review, on_hold
     """
-    # Use row locking to prevent race conditions from double-clicks
-    application = db.query(Application).filter(Application.id == application_id).with_for_update().first()
-    if not application:
+    user_id = user.get("id")
+    cache_key = _decision_cache_key(idempotency_key, user_id, "advance", application_id)
+    if cache_key is not None:
+        cached = _decision_responses.get(cache_key)
+        if cached is not None:
+            return cached
+
+    # Use row locking to prevent race conditions from double-clicks. Only
+    # the columns the transition needs are read; the row is never loaded
+    # into the session.
+    current = db.execute(
+        select(Application.status, Application.requisition_id)
+        .where(Application.id == application_id)
+        .with_for_update()
+    ).first()
+    if current is None:
         raise NotFoundError("Application", application_id)
 
-    if application.status not in ADVANCE_VALID_STATUSES:
+    from_status = current.status
+    if from_status not in ADVANCE_VALID_STATUSES:
         raise HTTPException(
             status_code=400,
-            detail=f"Cannot advance application with status '{application.status}'. Valid statuses: {ADVANCE_VALID_STATUSES}",
+            detail=f"Cannot advance application with status '{from_status}'. Valid statuses: {ADVANCE_VALID_LABEL}",
         )
 
-    from_status = application.status
     tms_stage_key = None  # Setting key to look up TMS stage ID
+    jobs = []  # Job rows queued by this transition, inserted together
 
     # Determine next status based on current status and config
-    if application.status == "ready_for_review":
+    if from_status == "ready_for_review":
         if data.skip_interview:
             to_status = "live_interview_pending"
             tms_stage_key = "tms_status_live_interview"
@@ -348,16 +632,16 @@ async def advance_application(
             # Queue interview send job
             to_status = "advancing"
             tms_stage_key = "tms_status_ai_interview"
-            job = Job(
-                application_id=application_id,
-                job_type="send_interview",
-                priority=5,
-            )
-            db.add(job)
-    elif application.status == "interview_ready_for_review":
+            jobs.append({
+                "application_id": application_id,
+                "job_type": "send_interview",
+                "priority": 5,
+                "payload": None,
+            })
+    elif from_status == "interview_ready_for_review":
         to_status = "advanced"
         tms_stage_key = "tms_status_advanced"
-    elif application.status == "on_hold":
+    elif from_status == "on_hold":
         # Restore to previous status or ready_for_review
         to_status = "ready_for_review"
         # No TMS sync for unhold - they stay in same TMS stage
@@ -365,30 +649,30 @@ async def advance_application(
         to_status = "advanced"
         tms_stage_key = "tms_status_advanced"
 
-    # Update application
-    application.status = to_status
-    application.advanced_by = user.get("id")
-    application.advanced_at = datetime.utcnow()
+    values = {
+        "status": to_status,
+        "advanced_by": user_id,
+        "advanced_at": func.getutcdate(),
+    }
 
     # Queue TMS sync job if we have a stage to sync
     if tms_stage_key:
         tms_stage_id = get_setting_value(db, tms_stage_key)
         if tms_stage_id:
             # Set sync status to pending
-            application.tms_sync_status = "pending"
-            application.tms_sync_error = None
+            values["tms_sync_status"] = "pending"
+            values["tms_sync_error"] = None
 
             # Queue the TMS sync job
-            sync_job = Job(
-                application_id=application_id,
-                job_type="update_workday_stage",
-                priority=3,  # Higher priority for sync jobs
-                payload=json.dumps({
+            jobs.append({
+                "application_id": application_id,
+                "job_type": "update_workday_stage",
+                "priority": 3,  # Higher priority for sync jobs
+                "payload": json_dumps({
                     "stage_id": tms_stage_id,
                     "action": "advance",
                 }),
-            )
-            db.add(sync_job)
+            })
             logger.info(
                 "Queued Workday sync job for advance",
                 application_id=application_id,
@@ -401,30 +685,44 @@ async def advance_application(
                 setting_key=tms_stage_key,
             )
 
+    # Update application. Re-checking the status we read makes the write
+    # fail cleanly if a concurrent decision got there first (SQL Server
+    # ignores FOR UPDATE, so the read above doesn't hold a lock there).
+    result = db.execute(
+        update(Application)
+        .where(Application.id == application_id, Application.status == from_status)
+        .values(**values),
+        execution_options={"synchronize_session": False},
+    )
+    if result.rowcount == 0:
+        _raise_invalid_transition(db, application_id, "advance", ADVANCE_VALID_LABEL)
+
+    # Both jobs go in one batched INSERT; their IDs come back for the log
+    job_ids = db.scalars(insert(Job).returning(Job.id), jobs).all() if jobs else []
+
     # Log decision
-    decision = ApplicationDecision(
+    db.execute(insert(ApplicationDecision).values(
         application_id=application_id,
         action="advance",
         from_status=from_status,
         to_status=to_status,
         comment=data.notes,
-        user_id=user.get("id", 0),
-    )
-    db.add(decision)
+        user_id=user_id or 0,
+    ))
 
-    # Log activity
-    activity = Activity(
+    # Log activity once the response is sent
+    background_tasks.add_task(
+        write_activity,
         action="application_advanced",
         application_id=application_id,
-        requisition_id=application.requisition_id,
-        recruiter_id=user.get("id"),
-        details=json.dumps({
+        requisition_id=current.requisition_id,
+        recruiter_id=user_id,
+        details={
             "from_status": from_status,
             "to_status": to_status,
             "skip_interview": data.skip_interview,
-        }),
+        },
     )
-    db.add(activity)
 
     db.commit()
 
@@ -433,10 +731,11 @@ async def advance_application(
         application_id=application_id,
         from_status=from_status,
         to_status=to_status,
-        user_id=user.get("id"),
+        user_id=user_id,
+        job_ids=job_ids,
     )
 
-    return DecisionResponse(
+    response = DecisionResponse(
         success=True,
         application_id=application_id,
         action="advance",
@@ -444,124 +743,116 @@ async def advance_application(
         to_status=to_status,
         message=f"Application advanced from {from_status} to {to_status}",
     )
+    if cache_key is not None:
+        _decision_responses.set(cache_key, response)
+    return response
 
 
 @router.post("/{application_id}/reject", response_model=DecisionResponse)
-async def reject_application(
+def reject_application(
     application_id: int,
     data: RejectRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
+    idempotency_key: Optional[str] = Header(None),
 ):
     """Reject an application with a legally defensible reason code.
 
     Note: No free-form comments allowed - they become discovery liabilities.
     """
-    logger.info(
-        "Reject request received",
-        application_id=application_id,
-        reason_code=data.reason_code.value,
-        user_id=user.get("id"),
-    )
+    user_id = user.get("id")
+    cache_key = _decision_cache_key(idempotency_key, user_id, "reject", application_id)
+    if cache_key is not None:
+        cached = _decision_responses.get(cache_key)
+        if cached is not None:
+            return cached
 
-    # Use row locking to prevent race conditions from double-clicks
-    application = db.query(Application).filter(Application.id == application_id).with_for_update().first()
-    if not application:
-        raise NotFoundError("Application", application_id)
+    reason_code = data.reason_code
+    log = logger.bind(application_id=application_id, reason_code=reason_code, user_id=user_id)
+    log.info("Reject request received")
 
-    if application.status not in REJECT_VALID_STATUSES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot reject application with status '{application.status}'. Valid statuses: {REJECT_VALID_STATUSES}",
-        )
-
-    from_status = application.status
     to_status = "rejected"
 
     # Look up the rejection reason to get external_id for TMS sync
-    reason_code = data.reason_code.value
-    rejection_reason = db.query(RejectionReason).filter(
-        RejectionReason.code == reason_code,
-        RejectionReason.is_active == True,
+    active_reasons = get_active_reason_external_ids(db)
+    disposition_id = active_reasons.get(reason_code)
+    sync_to_tms = bool(disposition_id)
+
+    values = {
+        "status": to_status,
+        "rejection_reason_code": reason_code,
+        "rejected_by": user_id,
+        "rejected_at": func.getutcdate(),
+    }
+    if sync_to_tms:
+        # Set sync status to pending
+        values["tms_sync_status"] = "pending"
+        values["tms_sync_error"] = None
+
+    # Conditional update: the status check and the write are one atomic
+    # statement, so double-clicks can't both succeed and no lock is held
+    # across round trips
+    updated = db.execute(
+        update(Application)
+        .where(Application.id == application_id, Application.status.in_(REJECT_VALID_STATUSES))
+        .values(**values)
+        .returning(_FROM_STATUS, Application.requisition_id),
+        execution_options={"synchronize_session": False},
     ).first()
+    if updated is None:
+        _raise_invalid_transition(db, application_id, "reject", REJECT_VALID_LABEL)
 
-    # Update application
-    application.status = to_status
-    application.rejection_reason_code = reason_code
-    application.rejected_by = user.get("id")
-    application.rejected_at = datetime.utcnow()
+    from_status = updated.from_status
 
     # Queue TMS sync job if we have the external disposition ID
-    if rejection_reason and rejection_reason.external_id:
-        # Set sync status to pending
-        application.tms_sync_status = "pending"
-        application.tms_sync_error = None
-
+    if sync_to_tms:
         # Queue the TMS sync job
-        sync_job = Job(
+        db.execute(insert(Job).values(
             application_id=application_id,
             job_type="update_workday_stage",
             priority=3,  # Higher priority for sync jobs
-            payload=json.dumps({
-                "disposition_id": rejection_reason.external_id,
+            payload=json_dumps({
+                "disposition_id": disposition_id,
                 "action": "reject",
             }),
-        )
-        db.add(sync_job)
-        logger.info(
-            "Queued Workday sync job for rejection",
-            application_id=application_id,
-            disposition_id=rejection_reason.external_id,
-        )
+        ))
+        log.info("Queued Workday sync job for rejection", disposition_id=disposition_id)
     else:
         # No sync job queued - log why
-        if not rejection_reason:
-            logger.warning(
-                "Rejection reason not found in database - Workday sync skipped",
-                application_id=application_id,
-                reason_code=reason_code,
-            )
-        elif not rejection_reason.external_id:
-            logger.warning(
-                "Rejection reason has no external_id - Workday sync skipped",
-                application_id=application_id,
-                reason_code=reason_code,
-            )
+        if reason_code not in active_reasons:
+            log.warning("Rejection reason not found in database - Workday sync skipped")
+        else:
+            log.warning("Rejection reason has no external_id - Workday sync skipped")
 
     # Log decision (no comment stored - discovery liability)
-    decision = ApplicationDecision(
+    db.execute(insert(ApplicationDecision).values(
         application_id=application_id,
         action="reject",
         from_status=from_status,
         to_status=to_status,
         reason_code=reason_code,
-        user_id=user.get("id", 0),
-    )
-    db.add(decision)
+        user_id=user_id or 0,
+    ))
 
-    # Log activity
-    activity = Activity(
+    # Log activity once the response is sent
+    background_tasks.add_task(
+        write_activity,
         action="application_rejected",
         application_id=application_id,
-        requisition_id=application.requisition_id,
-        recruiter_id=user.get("id"),
-        details=json.dumps({
+        requisition_id=updated.requisition_id,
+        recruiter_id=user_id,
+        details={
             "from_status": from_status,
             "reason_code": reason_code,
-        }),
+        },
     )
-    db.add(activity)
 
     db.commit()
 
-    logger.info(
-        "Application rejected",
-        application_id=application_id,
-        reason_code=reason_code,
-        user_id=user.get("id"),
-    )
+    log.info("Application rejected")
 
-    return DecisionResponse(
+    response = DecisionResponse(
         success=True,
         application_id=application_id,
         action="reject",
@@ -569,57 +860,68 @@ async def reject_application(
         to_status=to_status,
         message=f"Application rejected with reason: {reason_code}",
     )
+    if cache_key is not None:
+        _decision_responses.set(cache_key, response)
+    return response
 
 
 @router.post("/{application_id}/hold", response_model=DecisionResponse)
-async def hold_application(
+def hold_application(
     application_id: int,
     data: HoldRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
+    idempotency_key: Optional[str] = Header(None),
 ):
     """Put an application on hold.
 
     Note: No free-form reason accepted - discovery liability.
     """
-    # Use row locking to prevent race conditions from double-clicks
-    application = db.query(Application).filter(Application.id == application_id).with_for_update().first()
-    if not application:
-        raise NotFoundError("Application", application_id)
+    user_id = user.get("id")
+    cache_key = _decision_cache_key(idempotency_key, user_id, "hold", application_id)
+    if cache_key is not None:
+        cached = _decision_responses.get(cache_key)
+        if cached is not None:
+            return cached
 
-    if application.status not in HOLD_VALID_STATUSES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot hold application with status '{application.status}'. Valid statuses: {HOLD_VALID_STATUSES}",
-        )
-
-    from_status = application.status
     to_status = "on_hold"
 
-    # Update application
-    application.status = to_status
+    # Conditional update: the status check and the write are one atomic
+    # statement, so double-clicks can't both succeed and no lock is held
+    # across round trips
+    updated = db.execute(
+        update(Application)
+        .where(Application.id == application_id, Application.status.in_(HOLD_VALID_STATUSES))
+        .values(status=to_status)
+        .returning(_FROM_STATUS, Application.requisition_id),
+        execution_options={"synchronize_session": False},
+    ).first()
+    if updated is None:
+        _raise_invalid_transition(db, application_id, "hold", HOLD_VALID_LABEL)
+
+    from_status = updated.from_status
 
     # Log decision (no free-form reason - discovery liability)
-    decision = ApplicationDecision(
+    db.execute(insert(ApplicationDecision).values(
         application_id=application_id,
         action="hold",
         from_status=from_status,
         to_status=to_status,
-        user_id=user.get("id", 0),
-    )
-    db.add(decision)
+        user_id=user_id or 0,
+    ))
 
-    # Log activity
-    activity = Activity(
+    # Log activity once the response is sent
+    background_tasks.add_task(
+        write_activity,
         action="application_held",
         application_id=application_id,
-        requisition_id=application.requisition_id,
-        recruiter_id=user.get("id"),
-        details=json.dumps({
+        requisition_id=updated.requisition_id,
+        recruiter_id=user_id,
+        details={
             "from_status": from_status,
-        }),
+        },
     )
-    db.add(activity)
 
     db.commit()
 
@@ -627,10 +929,10 @@ async def hold_application(
         "Application held",
         application_id=application_id,
         from_status=from_status,
-        user_id=user.get("id"),
+        user_id=user_id,
     )
 
-    return DecisionResponse(
+    response = DecisionResponse(
         success=True,
         application_id=application_id,
         action="hold",
@@ -638,14 +940,19 @@ async def hold_application(
         to_status=to_status,
         message="Application placed on hold",
     )
+    if cache_key is not None:
+        _decision_responses.set(cache_key, response)
+    return response
 
 
 @router.post("/{application_id}/unreject", response_model=DecisionResponse)
-async def unreject_application(
+def unreject_application(
     application_id: int,
     data: UnrejectRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
+    idempotency_key: Optional[str] = Header(None),
 ):
     """Unreject an application (move back to ready_for_review).
 
@@ -657,73 +964,74 @@ async def unreject_application(
     - The wrong candidate was rejected by mistake
     - New information warrants reconsideration
     """
-    # Use row locking to prevent race conditions
-    application = db.query(Application).filter(Application.id == application_id).with_for_update().first()
-    if not application:
-        raise NotFoundError("Application", application_id)
-
-    if application.status != "rejected":
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot unreject application with status '{application.status}'. Only rejected applications can be unrejected.",
-        )
+    user_id = user.get("id")
+    cache_key = _decision_cache_key(idempotency_key, user_id, "unreject", application_id)
+    if cache_key is not None:
+        cached = _decision_responses.get(cache_key)
+        if cached is not None:
+            return cached
 
     # Find the status before rejection from the decision audit trail
-    last_rejection = (
-        db.query(ApplicationDecision)
-        .filter(
+    restore_status = db.scalar(
+        select(ApplicationDecision.from_status)
+        .where(
             ApplicationDecision.application_id == application_id,
             ApplicationDecision.action == "reject",
         )
         .order_by(ApplicationDecision.created_at.desc())
-        .first()
+        .limit(1)
     )
 
-    from_status = application.status
+    from_status = "rejected"
     # Restore to status before rejection, or default to ready_for_review
-    to_status = last_rejection.from_status if last_rejection else "ready_for_review"
-
-    # Update application
-    application.status = to_status
-    # Keep rejection_reason_code for audit trail but clear rejected_by/at
-    application.rejected_by = None
-    application.rejected_at = None
+    to_status = restore_status or "ready_for_review"
+
+    # Conditional update, as for the other decisions. Keep
+    # rejection_reason_code for audit trail but clear rejected_by/at.
+    updated = db.execute(
+        update(Application)
+        .where(Application.id == application_id, Application.status == from_status)
+        .values(status=to_status, rejected_by=None, rejected_at=None)
+        .returning(Application.requisition_id),
+        execution_options={"synchronize_session": False},
+    ).first()
+    if updated is None:
+        _raise_invalid_transition(db, application_id, "unreject", from_status)
 
     # Log decision WITH comment (unusual action needs audit trail)
-    decision = ApplicationDecision(
+    db.execute(insert(ApplicationDecision).values(
         application_id=application_id,
         action="unreject",
         from_status=from_status,
         to_status=to_status,
         comment=data.comment,  # Store the justification
-        user_id=user.get("id", 0),
-    )
-    db.add(decision)
+        user_id=user_id or 0,
+    ))
 
-    # Log activity
-    activity = Activity(
+    # Log activity once the response is sent
+    background_tasks.add_task(
+        write_activity,
         action="application_unrejected",
         application_id=application_id,
-        requisition_id=application.requisition_id,
-        recruiter_id=user.get("id"),
-        details=json.dumps({
+        requisition_id=updated.requisition_id,
+        recruiter_id=user_id,
+        details={
             "from_status": from_status,
             "comment": data.comment,
             "workday_synced": False,  # Explicitly note this is local-only
-        }),
+        },
     )
-    db.add(activity)
 
     db.commit()
 
     logger.info(
         "Application unrejected (local only - not synced to Workday)",
         application_id=application_id,
-        user_id=user.get("id"),
+        user_id=user_id,
         comment=data.comment,
     )
 
-    return DecisionResponse(
+    response = DecisionResponse(
         success=True,
         application_id=application_id,
         action="unreject",
@@ -731,16 +1039,19 @@ async def unreject_application(
         to_status=to_status,
         message="Application moved back to review. Note: This change was NOT synced to Workday.",
     )
+    if cache_key is not None:
+        _decision_responses.set(cache_key, response)
+    return response
 
 
 @router.get("/{application_id}/decisions", response_model=List[ApplicationDecisionItem])
-async def get_application_decisions(
+def get_application_decisions(
     application_id: int,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Get decision audit trail for an application."""
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = db.get(Application, application_id, options=APPLICATION_DETAIL_OPTS)
     if not application:
         raise NotFoundError("Application", application_id)
 
@@ -751,8 +1062,10 @@ async def get_application_decisions(
         .all()
     )
 
-    return [
-        ApplicationDecisionItem(
+    # Values come straight from typed columns, so skip validation here and
+    # in FastAPI's response_model check
+    return json_response([
+        ApplicationDecisionItem.model_construct(
             id=d.id,
             application_id=d.application_id,
             action=d.action,
@@ -764,43 +1077,28 @@ async def get_application_decisions(
             created_at=d.created_at,
         )
         for d in decisions
-    ]
+    ])
 
 
 @router.get("/{application_id}/facts", response_model=ExtractedFactsResponse)
-async def get_application_facts(
+def get_application_facts(
     application_id: int,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Get extracted facts for an application."""
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise NotFoundError("Application", application_id)
-
-    analysis = db.query(Analysis).filter(Analysis.application_id == application_id).first()
-    if not analysis:
-        raise NotFoundError("Analysis", application_id)
-
-    # Safely parse JSON fields
-    def safe_json_loads(data, default=None):
-        if not data:
-            return default if default is not None else []
-        try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
-            return default if default is not None else []
+    analysis = _load_analysis(db, application_id)
 
     return ExtractedFactsResponse(
         id=analysis.id,
         application_id=analysis.application_id,
         extraction_version=analysis.extraction_version,
         extraction_notes=analysis.extraction_notes,
-        extracted_facts=safe_json_loads(analysis.extracted_facts, None),
+        extracted_facts=analysis.extracted_facts,
         relevance_summary=analysis.relevance_summary,
-        pros=safe_json_loads(analysis.pros),
-        cons=safe_json_loads(analysis.cons),
-        suggested_questions=safe_json_loads(analysis.suggested_questions),
+        pros=analysis.pros or [],
+        cons=analysis.cons or [],
+        suggested_questions=analysis.suggested_questions or [],
         model_version=analysis.model_version,
         created_at=analysis.created_at,
     )
@@ -808,76 +1106,118 @@ async def get_application_facts(
 
 # Download endpoints
 
+# Characters dropped from candidate names in download filenames. \w is
+# Unicode-aware, so accented names keep their letters (as with isalnum()).
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w -]+")
+
+
+# Resume artifact fields, read with JSON_VALUE. The path is inlined as a
+# literal because SQL Server 2016 rejects a parameterized JSON path.
+_RESUME_KEY = func.json_value(Application.artifacts, literal_column("'$.resume'")).label("resume_key")
+_RESUME_FILENAME = func.json_value(
+    Application.artifacts, literal_column("'$.resume_filename'")
+).label("resume_filename")
+
+
 class DownloadUrlResponse(BaseModel):
     url: str
     filename: str
 
 
 @router.get("/{application_id}/resume/download", response_model=DownloadUrlResponse)
-async def get_resume_download_url(
+def get_resume_download_url(
     application_id: int,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Get presigned URL to download the resume."""
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
+    # Pull just the two keys out of the artifacts JSON on the server, so
+    # the whole document isn't sent back and decoded
+    row = db.execute(
+        select(_RESUME_KEY, _RESUME_FILENAME).where(Application.id == application_id)
+    ).first()
+    if row is None:
         raise NotFoundError("Application", application_id)
 
-    # Parse artifacts to get resume key
-    try:
-        artifacts = json.loads(application.artifacts) if application.artifacts else {}
-    except (json.JSONDecodeError, TypeError):
-        artifacts = {}
-
-    resume_key = artifacts.get("resume")
+    resume_key = row.resume_key
     if not resume_key:
         raise HTTPException(status_code=404, detail="No resume available for this application")
 
-    filename = artifacts.get("resume_filename", "resume.pdf")
+    filename = row.resume_filename or "resume.pdf"
 
     # Generate presigned URL
-    s3 = S3Service()
-    url = await s3.get_presigned_url(resume_key, expires_in=3600)
+    s3 = get_s3_service()
+    url = s3.get_presigned_url(resume_key, expires_in=3600)
 
     return DownloadUrlResponse(url=url, filename=filename)
 
 
 @router.get("/{application_id}/report/download", response_model=DownloadUrlResponse)
-async def get_report_download_url(
+def get_report_download_url(
     application_id: int,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Get presigned URL to download the analysis report."""
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
+    # Application and its latest report in one round trip; the outer join
+    # still yields a row (with no report) for an application without one
+    row = db.execute(
+        select(Application.candidate_name, Report.s3_key)
+        .outerjoin(Report, Report.application_id == Application.id)
+        .where(Application.id == application_id)
+        .order_by(Report.created_at.desc())
+        .limit(1)
+    ).first()
+    if row is None:
         raise NotFoundError("Application", application_id)
-
-    # Get the report
-    report = db.query(Report).filter(Report.application_id == application_id).order_by(Report.created_at.desc()).first()
-    if not report or not report.s3_key:
+    if not row.s3_key:
         raise HTTPException(status_code=404, detail="No report available for this application")
 
     # Generate filename
-    safe_name = "".join(c for c in application.candidate_name if c.isalnum() or c in " -_").strip()
+    safe_name = _UNSAFE_FILENAME_RE.sub("", row.candidate_name or "").strip()
     filename = f"Candidate_Summary_{safe_name}.pdf"
 
     # Generate presigned URL
-    s3 = S3Service()
-    url = await s3.get_presigned_url(report.s3_key, expires_in=3600)
+    s3 = get_s3_service()
+    url = s3.get_presigned_url(row.s3_key, expires_in=3600)
 
     return DownloadUrlResponse(url=url, filename=filename)
 
 
 # Interview endpoints
 
+def _load_invite_context(db: Session, application_id: int):
+    """
+    Fetch just the application, requisition and recruiter fields the invite
+    flow uses, in one round trip.
+
+    Neither prepare nor activate modifies the application, so a narrow row
+    is enough; there's no need to hydrate three full ORM objects.
+    """
+    row = db.execute(
+        select(
+            Application.candidate_name,
+            Application.candidate_email,
+            Application.requisition_id,
+            Requisition.name.label("requisition_name"),
+            Recruiter.name.label("recruiter_name"),
+            Recruiter.email.label("recruiter_email"),
+        )
+        .join(Requisition, Application.requisition_id == Requisition.id)
+        .outerjoin(Recruiter, Requisition.recruiter_id == Recruiter.id)
+        .where(Application.id == application_id)
+    ).first()
+    if row is None:
+        raise NotFoundError("Application", application_id)
+    return row
+
+
 @router.post("/{application_id}/prepare-interview", response_model=PrepareInterviewResponse)
-async def prepare_interview(
+def prepare_interview(
     application_id: int,
     data: PrepareInterviewRequest,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Prepare an interview for an application (creates draft, returns preview).
 
@@ -888,9 +1228,7 @@ async def prepare_interview(
     The interview is created with status='draft' and is not accessible
     to the candidate until activated.
     """
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise NotFoundError("Application", application_id)
+    application = _load_invite_context(db, application_id)
 
     # Cancel any existing draft interviews (user is starting fresh)
     db.query(Interview).filter(
@@ -907,7 +1245,7 @@ async def prepare_interview(
         )
 
     # Generate token
-    token = secrets.token_urlsafe(32)
+    token = _new_interview_token()
     expires_at = datetime.now(timezone.utc) + timedelta(days=data.expiry_days)
 
     # Create interview with status='draft'
@@ -922,7 +1260,6 @@ async def prepare_interview(
     )
     db.add(interview)
     db.commit()
-    db.refresh(interview)
 
     # Build interview URL
     interview_url = f"{settings.FRONTEND_URL}/interview/{token}"
@@ -930,16 +1267,12 @@ async def prepare_interview(
     # Generate email preview only for email mode
     email_preview = None
     if data.mode == "email" and candidate_email:
-        recruiter_name = None
-        if application.requisition.recruiter:
-            recruiter_name = application.requisition.recruiter.name
-
         email_preview = generate_interview_email_preview(
             candidate_email=candidate_email,
             candidate_name=application.candidate_name,
-            position_title=application.requisition.name,
+            position_title=application.requisition_name,
             interview_url=interview_url,
-            recruiter_name=recruiter_name,
+            recruiter_name=application.recruiter_name,
             expiry_days=data.expiry_days,
         )
 
@@ -961,22 +1294,27 @@ async def prepare_interview(
 
 
 @router.post("/{application_id}/activate-interview", response_model=ActivateInterviewResponse)
-async def activate_interview(
+def activate_interview(
     application_id: int,
     data: ActivateInterviewRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Activate an interview (send email or just make link active).
 
     This is step 2 of the 2-step send flow.
 
-    method='email': Send email invitation, set status='scheduled'
+    method='email': Queue email invitation, set status='scheduled'
     method='link_only': Just activate the link (for manual distribution)
+
+    The email is sent in a background task after the response, so
+    email_queued means the invite was handed off, not delivered. email_sent
+    keeps its old name for existing clients and now carries the same value.
+    The interview's invite_sent_at, or invite_failed_at/invite_error, is
+    filled in once SES answers.
     """
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise NotFoundError("Application", application_id)
+    application = _load_invite_context(db, application_id)
 
     # Find the draft interview
     interview = db.query(Interview).filter(
@@ -1000,12 +1338,14 @@ async def activate_interview(
     # Calculate how many days were originally requested
     original_expiry_days = 7  # Default
     if interview.token_expires_at and interview.created_at:
-        original_expiry_days = (interview.token_expires_at.replace(tzinfo=timezone.utc) - interview.created_at.replace(tzinfo=timezone.utc)).days
+        # Both come back from the DATETIME columns as naive UTC
+        original_expiry_days = (interview.token_expires_at - interview.created_at).days
         if original_expiry_days < 1:
             original_expiry_days = 7
 
     # Reset expiration to start from now (so candidate gets full duration)
-    interview.token_expires_at = datetime.now(timezone.utc) + timedelta(days=original_expiry_days)
+    now = datetime.now(timezone.utc)
+    interview.token_expires_at = now + timedelta(days=original_expiry_days)
     interview.status = "scheduled"
 
     # Update email if overridden at activation time
@@ -1015,96 +1355,76 @@ async def activate_interview(
     # Build interview URL
     interview_url = f"{settings.FRONTEND_URL}/interview/{interview.token}"
 
-    email_sent = False
+    email_queued = False
     email_sent_to = None
 
     if data.method == "email":
-        # Send email via SES
-        try:
-            from api.integrations.ses import SESService
-            from api.endpoints.settings import get_setting_value
-
-            # Get email settings from database (falls back to config defaults)
-            from_email = get_setting_value(db, "email_from_address", "")
-            from_name = get_setting_value(db, "email_from_name", "")
-
-            ses = SESService(
-                from_email=from_email if from_email else None,
-                from_name=from_name if from_name else None,
-            )
-            recruiter_email = None
-            recruiter_name = None
-            if application.requisition.recruiter:
-                recruiter_email = application.requisition.recruiter.email
-                recruiter_name = application.requisition.recruiter.name
-
-            # Use custom HTML/subject if provided, otherwise use template
-            if data.custom_html and data.custom_subject:
-                await ses.send_email(
-                    to=final_email,
-                    subject=data.custom_subject,
-                    html_body=data.custom_html,
-                    reply_to=recruiter_email,
-                )
-            else:
-                await ses.send_interview_invite(
-                    to=final_email,
-                    candidate_name=application.candidate_name,
-                    position=application.requisition.name,
-                    interview_url=interview_url,
-                    recruiter_name=recruiter_name,
-                    recruiter_email=recruiter_email,
-                    expires_in_days=7,
-                )
-
-            interview.invite_sent_at = datetime.now(timezone.utc)
-            email_sent = True
-            email_sent_to = final_email
-
-            logger.info(
-                "Interview email sent",
-                interview_id=interview.id,
-                to=final_email,
-                custom_email=bool(data.custom_html),
-            )
-
-        except Exception as e:
-            logger.error("Failed to send interview email", error=str(e))
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to send email: {str(e)}",
-            )
+        # Get email settings from database (falls back to config defaults)
+        from_email = get_setting_value(db, "email_from_address", "")
+        from_name = get_setting_value(db, "email_from_name", "")
+
+        # Use custom HTML/subject if provided, otherwise use template
+        if data.custom_html and data.custom_subject:
+            send_kwargs = {
+                "to": final_email,
+                "subject": data.custom_subject,
+                "html_body": data.custom_html,
+                "reply_to": application.recruiter_email,
+            }
+        else:
+            send_kwargs = {
+                "to": final_email,
+                "candidate_name": application.candidate_name,
+                "position": application.requisition_name,
+                "interview_url": interview_url,
+                "recruiter_name": application.recruiter_name,
+                "recruiter_email": application.recruiter_email,
+                "expires_in_days": 7,
+            }
+
+        # SES is called after the response is sent; the task records the
+        # result on the interview
+        background_tasks.add_task(
+            send_interview_invite,
+            interview_id=interview.id,
+            from_email=from_email or None,
+            from_name=from_name or None,
+            custom=bool(data.custom_html and data.custom_subject),
+            send_kwargs=send_kwargs,
+        )
+        email_queued = True
+        email_sent_to = final_email
 
     db.commit()
 
-    # Log activity
-    activity = Activity(
+    # Log activity once the response is sent
+    background_tasks.add_task(
+        write_activity,
         action="interview_activated" if data.method == "link_only" else "interview_sent",
         application_id=application_id,
         requisition_id=application.requisition_id,
         recruiter_id=user.get("id"),
-        details=json.dumps({
+        details={
             "interview_id": interview.id,
             "method": data.method,
-            "email_sent": email_sent,
+            "email_queued": email_queued,
             "email_sent_to": email_sent_to,
-        }),
+        },
     )
-    db.add(activity)
-    db.commit()
 
     logger.info(
         "Interview activated",
         interview_id=interview.id,
         method=data.method,
-        email_sent=email_sent,
+        email_queued=email_queued,
     )
 
     return ActivateInterviewResponse(
         interview_id=interview.id,
         interview_url=interview_url,
         expires_at=interview.token_expires_at,
-        email_sent=email_sent,
+        email_sent=email_queued,
+        email_queued=email_queued,
         email_sent_to=email_sent_to,
     )
 
@@ -1113,8 +1433,9 @@ async def activate_interview(
 async def start_proxy_interview(
     application_id: int,
     data: StartProxyInterviewRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    user: dict = Depends(require_role(["admin", "recruiter"])),
+    user: dict = Depends(require_recruiter),
 ):
     """Start a proxy interview (recruiter conducts on candidate's behalf).
 
@@ -1124,19 +1445,21 @@ async def start_proxy_interview(
     No email or token is generated - the recruiter uses their authenticated
     session to conduct the interview.
     """
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = db.get(Application, application_id)
     if not application:
         raise NotFoundError("Application", application_id)
 
     # Check if there's already an active interview
-    existing = db.query(Interview).filter(
-        Interview.application_id == application_id,
-        Interview.status.in_(["in_progress"]),
-    ).first()
-    if existing:
+    existing_id = db.scalar(
+        select(Interview.id).where(
+            Interview.application_id == application_id,
+            Interview.status == "in_progress",
+        )
+    )
+    if existing_id is not None:
         raise HTTPException(
             status_code=400,
-            detail=f"Application already has an interview in progress (id={existing.id})",
+            detail=f"Application already has an interview in progress (id={existing_id})",
         )
 
     # Create proxy interview
@@ -1146,31 +1469,30 @@ async def start_proxy_interview(
         status="in_progress",
         persona_id=data.persona_id,
         recruiter_id=user.get("id"),
-        started_at=datetime.now(timezone.utc),
     )
     db.add(interview)
-    db.commit()
-    db.refresh(interview)
+    db.flush()  # Assigns interview.id without ending the transaction
 
-    # Generate initial greeting using InterviewService
+    # Generate initial greeting using InterviewService. It stamps started_at,
+    # and its commit also commits the interview, so a failed greeting leaves
+    # no half-started interview behind.
     service = InterviewService(db)
     initial_message = await service.start_interview(
         interview_id=interview.id,
         interview_type="proxy",
     )
 
-    # Log activity
-    activity = Activity(
+    # Log activity once the response is sent
+    background_tasks.add_task(
+        write_activity,
         action="proxy_interview_started",
         application_id=application_id,
         requisition_id=application.requisition_id,
         recruiter_id=user.get("id"),
-        details=json.dumps({
+        details={
             "interview_id": interview.id,
-        }),
+        },
     )
-    db.add(activity)
-    db.commit()
 
     logger.info(
         "Proxy interview started",
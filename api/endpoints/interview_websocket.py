@@ -9,6 +9,7 @@ from typing import Optional, Tuple
 
 import structlog
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -270,7 +271,7 @@ async def interview_websocket(websocket: WebSocket, token: str):
         # Start interview if not already started (draft or scheduled -> in_progress)
         if interview.status in ("draft", "scheduled"):
             interview.status = "in_progress"
-            interview.started_at = datetime.now(timezone.utc)
+            interview.started_at = func.getutcdate()  # DB clock, as in InterviewService.start_interview
             db.commit()
 
         # Check if we need to generate a greeting (no messages yet)
@@ -475,7 +476,7 @@ async def interview_websocket(websocket: WebSocket, token: str):
                         application_id=interview.application_id,
                         requisition_id=interview.application.requisition_id,
                         action="interview_completed",
-                        details=json.dumps({"interview_id": interview.id, "reason": complete_reason}),
+                        details={"interview_id": interview.id, "reason": complete_reason},
                     )
                     db.add(activity)
 
@@ -565,7 +566,7 @@ async def interview_websocket(websocket: WebSocket, token: str):
                     application_id=interview.application_id,
                     requisition_id=interview.application.requisition_id,
                     action="interview_completed",
-                    details=json.dumps({"interview_id": interview.id, "reason": "user_ended"}),
+                    details={"interview_id": interview.id, "reason": "user_ended"},
                 )
                 db.add(activity)
 
@@ -1,13 +1,13 @@
 """Interview CRUD endpoints."""
 
-import json
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 import structlog
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from api.config.database import get_db
 from api.middleware.error_handler import NotFoundError
@@ -43,7 +43,14 @@ async def list_interviews(
     user: dict = Depends(require_role(["admin", "recruiter"])),
 ):
     """List all interviews with pagination."""
-    query = db.query(Interview).join(Application).join(Requisition)
+    # Populate interview.application.requisition from the joined rows so
+    # building the page doesn't lazy-load two relationships per row
+    query = (
+        db.query(Interview)
+        .join(Interview.application)
+        .join(Application.requisition)
+        .options(contains_eager(Interview.application).contains_eager(Application.requisition))
+    )
 
     # Filters
     if application_id:
@@ -66,7 +73,7 @@ async def list_interviews(
         .filter(Message.interview_id.in_(interview_ids))
         .group_by(Message.interview_id)
         .all()
-    )
+    ) if interview_ids else {}
 
     items = [
         InterviewListItem(
@@ -124,6 +131,9 @@ async def get_interview(
         token=interview.token,
         token_expires_at=interview.token_expires_at,
         persona_id=interview.persona_id,
+        invite_sent_at=interview.invite_sent_at,
+        invite_failed_at=interview.invite_failed_at,
+        invite_error=interview.invite_error,
         created_at=interview.created_at,
         started_at=interview.started_at,
         completed_at=interview.completed_at,
@@ -186,12 +196,12 @@ async def get_interview_evaluation(
         growth_potential_score=evaluation.growth_potential_score,
         overall_score=evaluation.overall_score,
         summary=evaluation.summary,
-        strengths=json.loads(evaluation.strengths) if evaluation.strengths else [],
-        weaknesses=json.loads(evaluation.weaknesses) if evaluation.weaknesses else [],
-        red_flags=json.loads(evaluation.red_flags) if evaluation.red_flags else [],
-        interview_highlights=json.loads(evaluation.interview_highlights) if evaluation.interview_highlights else [],
+        strengths=orjson.loads(evaluation.strengths) if evaluation.strengths else [],
+        weaknesses=orjson.loads(evaluation.weaknesses) if evaluation.weaknesses else [],
+        red_flags=orjson.loads(evaluation.red_flags) if evaluation.red_flags else [],
+        interview_highlights=orjson.loads(evaluation.interview_highlights) if evaluation.interview_highlights else [],
         recommendation=evaluation.recommendation,
-        next_interview_focus=json.loads(evaluation.next_interview_focus) if evaluation.next_interview_focus else [],
+        next_interview_focus=orjson.loads(evaluation.next_interview_focus) if evaluation.next_interview_focus else [],
         model_version=evaluation.model_version,
         created_at=evaluation.created_at,
     )
@@ -216,7 +226,6 @@ async def create_interview(
     )
     db.add(job)
     db.commit()
-    db.refresh(job)
 
     logger.info("Interview creation queued", application_id=data.application_id, job_id=job.id)
 
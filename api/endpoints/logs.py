@@ -1,6 +1,5 @@
 """Activity/logs endpoints."""
 
-import json
 from typing import Optional
 
 import structlog
@@ -70,7 +69,7 @@ async def list_activities(
             application_id=a.application_id,
             candidate_name=app_names.get(a.application_id),
             requisition_name=req_names.get(a.requisition_id),
-            details=json.loads(a.details) if a.details else None,
+            details=a.details,
             created_at=a.created_at,
         )
         for a in activities
@@ -5,11 +5,11 @@ from typing import Optional
 import structlog
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from api.config.database import get_db
 from api.middleware.error_handler import NotFoundError
-from api.models import Job, Application, Requisition
+from api.models import Job, Application
 from api.schemas.queue import (
     QueueItem,
     QueueStatusResponse,
@@ -38,7 +38,13 @@ async def get_queue_status(
     )
 
     # Get recent items
-    query = db.query(Job).join(Application).join(Requisition)
+    # Load job.application.requisition from the join rather than lazily per row
+    query = (
+        db.query(Job)
+        .join(Job.application)
+        .join(Application.requisition)
+        .options(contains_eager(Job.application).contains_eager(Application.requisition))
+    )
     if status_filter:
         query = query.filter(Job.status == status_filter)
     else:
@@ -90,7 +96,6 @@ async def add_to_queue(
     )
     db.add(job)
     db.commit()
-    db.refresh(job)
 
     logger.info("Job added manually", job_id=job.id, job_type=job.job_type)
 
@@ -1,16 +1,17 @@
 """Requisition CRUD endpoints."""
 
-import json
 from typing import Optional
 
+import orjson
 import structlog
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from api.config.database import get_db
 from api.middleware.error_handler import NotFoundError
 from api.models import Requisition, Recruiter, Application, Job
+from api.models.types import json_dumps
 from api.schemas.requisitions import (
     RequisitionCreate,
     RequisitionUpdate,
@@ -76,11 +77,10 @@ async def list_requisitions(
     )
 
     # Get recruiter names
-    recruiter_ids = [r.recruiter_id for r in requisitions if r.recruiter_id]
-    recruiters = {
-        r.id: r.name
-        for r in db.query(Recruiter).filter(Recruiter.id.in_(recruiter_ids)).all()
-    }
+    recruiter_ids = {r.recruiter_id for r in requisitions if r.recruiter_id}
+    recruiters = dict(
+        db.execute(select(Recruiter.id, Recruiter.name).where(Recruiter.id.in_(recruiter_ids))).all()
+    ) if recruiter_ids else {}
 
     items = [
         RequisitionListItem(
@@ -136,7 +136,7 @@ async def get_requisition(
         auto_send_interview=requisition.auto_send_interview,  # 3-state: None = use global
         auto_send_on_status=requisition.auto_send_on_status,
         last_synced_at=requisition.last_synced_at,
-        external_data=json.loads(requisition.external_data) if requisition.external_data else None,
+        external_data=orjson.loads(requisition.external_data) if requisition.external_data else None,
         created_at=requisition.created_at,
         updated_at=requisition.updated_at,
     )
@@ -180,7 +180,6 @@ async def sync_all_requisitions(
     )
     db.add(job)
     db.commit()
-    db.refresh(job)
 
     logger.info("Sync all requisitions triggered", job_id=job.id)
 
@@ -207,11 +206,10 @@ async def sync_requisition(
         requisition_id=requisition_id,
         job_type="sync",
         priority=10,  # Higher priority for manual triggers
-        payload=json.dumps({"requisition_id": requisition_id}),
+        payload=json_dumps({"requisition_id": requisition_id}),
     )
     db.add(job)
     db.commit()
-    db.refresh(job)
 
     logger.info("Sync triggered for requisition", requisition_id=requisition_id, job_id=job.id)
 
@@ -6,11 +6,13 @@ from typing import List
 import structlog
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from api.config.database import get_db
 from api.models import Setting, DEFAULT_SETTINGS
 from api.schemas.settings import SettingsResponse, SettingsUpdate
+from api.services.cache import TTLCache
 from api.services.rbac import require_role, require_admin
 
 logger = structlog.get_logger()
@@ -24,11 +26,50 @@ class DispositionOption(BaseModel):
     workday_id: str | None = None
 
 
+# Stored setting values by key, as (settings version, value); value is None
+# when the row doesn't exist. An entry is only used while the settings
+# version it was read under is still current.
+_setting_cache = TTLCache(ttl=60, maxsize=256)
+
+# Row count and latest created/updated time of the settings table. Any
+# insert or update through the ORM, from any worker, changes it. It is
+# re-read at most every SETTINGS_VERSION_TTL seconds, which bounds how long
+# another worker can serve a value from before an admin's change.
+SETTINGS_VERSION_TTL = 5
+_SETTINGS_VERSION_STMT = select(
+    func.count(), func.max(func.coalesce(Setting.updated_at, Setting.created_at))
+)
+_settings_version = TTLCache(ttl=SETTINGS_VERSION_TTL, maxsize=1)
+
+
+def _current_settings_version(db: Session) -> tuple:
+    """Return the settings table's version, probing it at most once per TTL."""
+    version = _settings_version.get("settings")
+    if version is None:
+        version = tuple(db.execute(_SETTINGS_VERSION_STMT).one())
+        _settings_version.set("settings", version)
+    return version
+
+
+def _invalidate_settings_cache() -> None:
+    """Drop cached settings after a write from this worker."""
+    _settings_version.clear()
+    _setting_cache.clear()
+
+
 def get_setting_value(db: Session, key: str, default: str = "") -> str:
-    """Get a setting value from database."""
-    setting = db.query(Setting).filter(Setting.key == key).first()
-    if setting:
-        return setting.value
+    """Get a setting value from database (cached, see SETTINGS_VERSION_TTL)."""
+    version = _current_settings_version(db)
+    cached = _setting_cache.get(key)
+    if cached is not None and cached[0] == version:
+        value = cached[1]
+    else:
+        # Tagged with the version probed before the read, so a write that
+        # lands in between only makes the entry look older than it is
+        value = db.scalar(select(Setting.value).where(Setting.key == key))
+        _setting_cache.set(key, (version, value))
+    if value is not None:
+        return value
     return DEFAULT_SETTINGS.get(key, (default, ""))[0]
 
 
@@ -78,6 +119,7 @@ async def update_settings(
             set_setting_value(db, key, str(value))
 
     db.commit()
+    _invalidate_settings_cache()
 
     logger.info("Settings updated", keys=list(update_data.keys()))
     return await get_settings(db, user)
@@ -96,6 +138,7 @@ async def seed_settings(
             db.add(setting)
 
     db.commit()
+    _invalidate_settings_cache()
     logger.info("Settings seeded")
     return {"message": "Settings seeded successfully"}
 
@@ -5,15 +5,34 @@ from typing import List
 import structlog
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from api.config.database import get_db
 from api.models import RejectionReason, DEFAULT_REJECTION_REASONS
+from api.services.cache import TTLCache
 from api.services.rbac import require_role, require_admin
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Active reason code -> TMS disposition ID, loaded in one query. The table
+# is small and admin-edited; writes here invalidate it, other workers pick
+# changes up on expiry.
+_active_reasons_cache = TTLCache(ttl=300, maxsize=1)
+
+
+def get_active_reason_external_ids(db: Session) -> dict[str, str]:
+    """Map each active rejection reason code to its TMS disposition ID (cached)."""
+    reasons = _active_reasons_cache.get("active")
+    if reasons is None:
+        reasons = dict(db.execute(
+            select(RejectionReason.code, RejectionReason.external_id)
+            .where(RejectionReason.is_active == True)
+        ).all())
+        _active_reasons_cache.set("active", reasons)
+    return reasons
+
 
 # Schemas
 class RejectionReasonResponse(BaseModel):
@@ -99,6 +118,7 @@ async def create_rejection_reason(
     reason = RejectionReason(**data.model_dump())
     db.add(reason)
     db.commit()
+    _active_reasons_cache.clear()
     db.refresh(reason)
 
     logger.info("Rejection reason created", reason_id=reason.id, code=reason.code)
@@ -122,6 +142,7 @@ async def update_rejection_reason(
         setattr(reason, key, value)
 
     db.commit()
+    _active_reasons_cache.clear()
     db.refresh(reason)
 
     logger.info("Rejection reason updated", reason_id=reason_id)
@@ -141,6 +162,7 @@ async def delete_rejection_reason(
 
     reason.is_active = False
     db.commit()
+    _active_reasons_cache.clear()
 
     logger.info("Rejection reason deactivated", reason_id=reason_id)
     return {"message": "Rejection reason deactivated"}
@@ -163,5 +185,6 @@ async def seed_rejection_reasons(
             created += 1
 
     db.commit()
+    _active_reasons_cache.clear()
     logger.info("Rejection reasons seeded", created=created)
     return {"message": f"Seeded {created} rejection reasons"}
@@ -1,10 +1,13 @@
 """SES integration for sending emails."""
 
+import asyncio
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 import boto3
 import structlog
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from api.config.settings import settings
@@ -15,6 +18,34 @@ logger = structlog.get_logger()
 TEMPLATE_DIR = Path(__file__).parent.parent / "config" / "templates"
 
 
+# Shared by every SESService so concurrent sends reuse pooled HTTPS
+# connections instead of opening a new TLS session each time
+SES_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
+@lru_cache
+def _get_ses_client():
+    """Build the SES client once per process."""
+    client_kwargs = {"region_name": settings.SES_REGION, "config": SES_CLIENT_CONFIG}
+    # Explicitly pass SES-specific credentials if configured
+    if settings.SES_ACCESS_KEY_ID and settings.SES_SECRET_ACCESS_KEY:
+        client_kwargs["aws_access_key_id"] = settings.SES_ACCESS_KEY_ID
+        client_kwargs["aws_secret_access_key"] = settings.SES_SECRET_ACCESS_KEY
+    return boto3.client("ses", **client_kwargs)
+
+
+@lru_cache
+def _read_template(name: str) -> str:
+    """Read a template file once per process; templates ship with the image."""
+    template_path = TEMPLATE_DIR / name
+    if not template_path.exists():
+        raise FileNotFoundError(f"Template not found: {template_path}")
+    return template_path.read_text(encoding="utf-8")
+
+
 class SESService:
     """Service for sending emails via AWS SES."""
 
@@ -25,13 +56,7 @@ class SESService:
             from_email: Override sender email (defaults to settings.SES_FROM_EMAIL)
             from_name: Override sender name (defaults to settings.SES_FROM_NAME)
         """
-        # Explicitly pass SES-specific credentials if configured
-        client_kwargs = {"region_name": settings.SES_REGION}
-        if settings.SES_ACCESS_KEY_ID and settings.SES_SECRET_ACCESS_KEY:
-            client_kwargs["aws_access_key_id"] = settings.SES_ACCESS_KEY_ID
-            client_kwargs["aws_secret_access_key"] = settings.SES_SECRET_ACCESS_KEY
-
-        self.client = boto3.client("ses", **client_kwargs)
+        self.client = _get_ses_client()
         self.from_email = from_email or settings.SES_FROM_EMAIL
         self.from_name = from_name or settings.SES_FROM_NAME
 
@@ -90,7 +115,8 @@ class SESService:
             if reply_to:
                 params["ReplyToAddresses"] = [reply_to]
 
-            response = self.client.send_email(**params)
+            # boto3 is blocking; run the HTTPS call off the event loop
+            response = await asyncio.to_thread(self.client.send_email, **params)
 
             message_id = response["MessageId"]
 
@@ -109,10 +135,7 @@ class SESService:
 
     def _load_template(self, name: str) -> str:
         """Load a template file by name."""
-        template_path = TEMPLATE_DIR / name
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
-        return template_path.read_text(encoding="utf-8")
+        return _read_template(name)
 
     def _render_template(self, template: str, **kwargs) -> str:
         """Render a template with {{variable}} syntax."""
@@ -168,6 +191,12 @@ class SESService:
         )
 
 
+@lru_cache
+def get_ses_service(from_email: Optional[str] = None, from_name: Optional[str] = None) -> SESService:
+    """Get the shared SES service for a sender address/name."""
+    return SESService(from_email=from_email, from_name=from_name)
+
+
 class SESError(Exception):
     """Raised when SES operations fail."""
     pass
@@ -7,6 +7,7 @@ Run with: uvicorn api.main:app --reload
 
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -35,6 +36,10 @@ async def lifespan(app: FastAPI):
         debug=settings.DEBUG,
     )
 
+    # Sync (def) endpoints run in the threadpool; size it for pyodbc-bound
+    # request concurrency instead of anyio's default of 40
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
     # Initialize database tables (in dev mode)
     if settings.DEBUG:
         logger.info("Initializing database tables (DEBUG mode)")
@@ -1,5 +1,6 @@
 """Request logging middleware using structlog."""
 
+import logging
 import time
 import uuid
 
@@ -8,6 +9,8 @@ from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
+from api.config.settings import settings
+
 logger = structlog.get_logger()
 
 
@@ -23,7 +26,10 @@ def configure_logging() -> None:
             structlog.processors.UnicodeDecoder(),
             structlog.processors.JSONRenderer(),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(20),  # INFO level
+        # Calls below LOG_LEVEL return immediately, before any processors run
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
+        ),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
@@ -0,0 +1,92 @@
+"""Add full-text index on applications.candidate_name.
+
+The application list search used a leading-wildcard LIKE, which can't use
+an index and scans the whole table. A full-text index lets the search run
+as CONTAINS() prefix matching instead (enable with SEARCH_USE_FULLTEXT).
+
+Full-text search is an optional SQL Server feature; when it isn't
+installed this migration is a no-op and the API keeps using LIKE.
+
+Revision ID: 00025
+Revises: 00024
+Create Date: 2024-12-28
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "00025"
+down_revision = "00024"
+branch_labels = None
+depends_on = None
+
+CATALOG_NAME = "ftc_airecruiter"
+
+
+def fulltext_installed() -> bool:
+    """Check if the Full-Text Search feature is installed on the server."""
+    conn = op.get_bind()
+    result = conn.execute(text("SELECT CAST(SERVERPROPERTY('IsFullTextInstalled') AS INT)"))
+    return result.scalar() == 1
+
+
+def catalog_exists(catalog_name: str) -> bool:
+    """Check if a full-text catalog exists."""
+    conn = op.get_bind()
+    result = conn.execute(text("""
+        SELECT COUNT(*) FROM sys.fulltext_catalogs
+        WHERE name = :catalog_name
+    """), {"catalog_name": catalog_name})
+    return result.scalar() > 0
+
+
+def fulltext_index_exists(table_name: str) -> bool:
+    """Check if a table already has a full-text index."""
+    conn = op.get_bind()
+    result = conn.execute(text("""
+        SELECT COUNT(*) FROM sys.fulltext_indexes
+        WHERE object_id = OBJECT_ID(:table_name)
+    """), {"table_name": table_name})
+    return result.scalar() > 0
+
+
+def primary_key_name(table_name: str) -> str:
+    """Get the (server-generated) primary key index name for a table."""
+    conn = op.get_bind()
+    result = conn.execute(text("""
+        SELECT name FROM sys.indexes
+        WHERE object_id = OBJECT_ID(:table_name) AND is_primary_key = 1
+    """), {"table_name": table_name})
+    return result.scalar()
+
+
+def upgrade() -> None:
+    """Create full-text catalog and index for candidate name search."""
+    if not fulltext_installed():
+        return
+
+    # Full-text DDL is not allowed inside a user transaction
+    with op.get_context().autocommit_block():
+        if not catalog_exists(CATALOG_NAME):
+            op.execute(text(f"CREATE FULLTEXT CATALOG {CATALOG_NAME}"))
+
+        if not fulltext_index_exists("applications"):
+            pk_name = primary_key_name("applications")
+            op.execute(text(f"""
+                CREATE FULLTEXT INDEX ON applications (candidate_name)
+                KEY INDEX [{pk_name}] ON {CATALOG_NAME}
+                WITH CHANGE_TRACKING AUTO
+            """))
+
+
+def downgrade() -> None:
+    """Remove full-text index and catalog."""
+    if not fulltext_installed():
+        return
+
+    with op.get_context().autocommit_block():
+        if fulltext_index_exists("applications"):
+            op.execute(text("DROP FULLTEXT INDEX ON applications"))
+        if catalog_exists(CATALOG_NAME):
+            op.execute(text(f"DROP FULLTEXT CATALOG {CATALOG_NAME}"))
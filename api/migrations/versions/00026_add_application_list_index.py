@@ -0,0 +1,64 @@
+"""Add covering index for the application list page.
+
+The list endpoint filters by requisition_id and status and orders by
+created_at DESC. This index lets SQL Server seek to the requisition/status
+range and read rows already in page order, and INCLUDE-s the remaining
+list columns so the page is served from the index without key lookups.
+
+Revision ID: 00026
+Revises: 00025
+Create Date: 2024-12-28
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "00026"
+down_revision = "00025"
+branch_labels = None
+depends_on = None
+
+# Application columns returned by the list endpoint that aren't index keys
+LIST_INCLUDE_COLUMNS = [
+    "external_application_id",
+    "candidate_name",
+    "candidate_email",
+    "workday_status",
+    "compliance_review",
+    "rejection_reason_code",
+    "jd_match_percentage",
+    "total_experience_months",
+    "avg_tenure_months",
+    "current_title",
+    "current_employer",
+    "months_since_last_employment",
+]
+
+
+def index_exists(index_name: str) -> bool:
+    """Check if an index exists."""
+    conn = op.get_bind()
+    result = conn.execute(text("""
+        SELECT COUNT(*) FROM sys.indexes
+        WHERE name = :index_name
+    """), {"index_name": index_name})
+    return result.scalar() > 0
+
+
+def upgrade() -> None:
+    """Create the list-page covering index."""
+    if not index_exists("ix_applications_list"):
+        op.create_index(
+            "ix_applications_list",
+            "applications",
+            ["requisition_id", "status", sa.text("created_at DESC")],
+            mssql_include=LIST_INCLUDE_COLUMNS,
+        )
+
+
+def downgrade() -> None:
+    """Remove the list-page covering index."""
+    if index_exists("ix_applications_list"):
+        op.drop_index("ix_applications_list", table_name="applications")
@@ -0,0 +1,47 @@
+"""Add status/created_at index for the all-requisitions list view.
+
+ix_applications_list leads with requisition_id, so it can't serve the
+list page when no requisition is selected. This index covers the status
+filter (and exclude_statuses ranges) ordered by created_at DESC for that
+view. Candidate name search is handled by the full-text index (00025).
+
+Revision ID: 00027
+Revises: 00026
+Create Date: 2024-12-28
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "00027"
+down_revision = "00026"
+branch_labels = None
+depends_on = None
+
+
+def index_exists(index_name: str) -> bool:
+    """Check if an index exists."""
+    conn = op.get_bind()
+    result = conn.execute(text("""
+        SELECT COUNT(*) FROM sys.indexes
+        WHERE name = :index_name
+    """), {"index_name": index_name})
+    return result.scalar() > 0
+
+
+def upgrade() -> None:
+    """Create the status/created_at index."""
+    if not index_exists("ix_applications_status_created"):
+        op.create_index(
+            "ix_applications_status_created",
+            "applications",
+            ["status", sa.text("created_at DESC")],
+        )
+
+
+def downgrade() -> None:
+    """Remove the status/created_at index."""
+    if index_exists("ix_applications_status_created"):
+        op.drop_index("ix_applications_status_created", table_name="applications")
@@ -0,0 +1,49 @@
+"""Add (application_id, status) index on interviews.
+
+Interview lookups for an application filter on status as well: the
+in-progress check when starting a proxy interview, and finding or
+cancelling draft interviews in the prepare/activate flow. Without an
+index each of these scans the interviews table.
+
+A filtered index (WHERE status = 'in_progress') isn't used because SQL
+Server won't match it against the parameterized queries SQLAlchemy sends.
+
+Revision ID: 00028
+Revises: 00027
+Create Date: 2024-12-28
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "00028"
+down_revision = "00027"
+branch_labels = None
+depends_on = None
+
+
+def index_exists(index_name: str) -> bool:
+    """Check if an index exists."""
+    conn = op.get_bind()
+    result = conn.execute(text("""
+        SELECT COUNT(*) FROM sys.indexes
+        WHERE name = :index_name
+    """), {"index_name": index_name})
+    return result.scalar() > 0
+
+
+def upgrade() -> None:
+    """Create the application/status index."""
+    if not index_exists("ix_interviews_application_status"):
+        op.create_index(
+            "ix_interviews_application_status",
+            "interviews",
+            ["application_id", "status"],
+        )
+
+
+def downgrade() -> None:
+    """Remove the application/status index."""
+    if index_exists("ix_interviews_application_status"):
+        op.drop_index("ix_interviews_application_status", table_name="interviews")
@@ -0,0 +1,49 @@
+"""Add requisition/jd_match_percentage index for ranked list pages.
+
+Recruiters mostly sort a requisition's applicants by JD match. The other
+list orderings are already indexed (ix_applications_list for
+requisition/status/created_at, ix_applications_status_created for the
+all-requisitions view), so without this index that sort scans every
+application in the requisition and sorts them. The other sort columns
+are rarely used and are left unindexed to keep sync writes cheap.
+
+Revision ID: 00029
+Revises: 00028
+Create Date: 2024-12-28
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "00029"
+down_revision = "00028"
+branch_labels = None
+depends_on = None
+
+
+def index_exists(index_name: str) -> bool:
+    """Check if an index exists."""
+    conn = op.get_bind()
+    result = conn.execute(text("""
+        SELECT COUNT(*) FROM sys.indexes
+        WHERE name = :index_name
+    """), {"index_name": index_name})
+    return result.scalar() > 0
+
+
+def upgrade() -> None:
+    """Create the requisition/jd_match_percentage index."""
+    if not index_exists("ix_applications_req_jd_match"):
+        op.create_index(
+            "ix_applications_req_jd_match",
+            "applications",
+            ["requisition_id", sa.text("jd_match_percentage DESC")],
+        )
+
+
+def downgrade() -> None:
+    """Remove the requisition/jd_match_percentage index."""
+    if index_exists("ix_applications_req_jd_match"):
+        op.drop_index("ix_applications_req_jd_match", table_name="applications")
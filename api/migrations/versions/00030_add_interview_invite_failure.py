@@ -0,0 +1,39 @@
+"""Add invite failure tracking to interviews.
+
+Invite emails are sent in a background task after activate-interview
+responds. When SES rejects the send, the interview is already scheduled,
+so record the failure on the row for the recruiter to see and resend:
+- invite_failed_at: when the last send failed
+- invite_error: the SES error message
+
+Revision ID: 00030
+Revises: 00029
+Create Date: 2024-12-28
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "00030"
+down_revision = "00029"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add invite failure columns."""
+    op.add_column(
+        "interviews",
+        sa.Column("invite_failed_at", sa.DateTime, nullable=True),
+    )
+    op.add_column(
+        "interviews",
+        sa.Column("invite_error", sa.String(500), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove invite failure columns."""
+    op.drop_column("interviews", "invite_error")
+    op.drop_column("interviews", "invite_failed_at")
@@ -1,10 +1,11 @@
 """Activity model for business audit trail."""
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy import func
 from sqlalchemy.orm import relationship
 
 from api.config.database import Base
+from api.models.types import JSONText
 
 
 class Activity(Base):
@@ -41,7 +42,7 @@ class Activity(Base):
 
     # Details (JSON)
     # {"from_status": "new", "to_status": "analyzed", "by": "system"}
-    details = Column(Text, nullable=True)
+    details = Column(JSONText, nullable=True)
 
     # Timestamp
     created_at = Column(DateTime, default=func.getutcdate())
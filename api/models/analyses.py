@@ -5,6 +5,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import relationship
 
 from api.config.database import Base
+from api.models.types import JSONText
 
 
 class Analysis(Base):
@@ -26,18 +27,18 @@ class Analysis(Base):
     )
 
     # Extracted facts (JSON blob with employment, skills, certs, education, timeline)
-    extracted_facts = Column(Text, nullable=True)
+    extracted_facts = Column(JSONText, nullable=True)
     extraction_version = Column(String(20), nullable=True)  # Schema version
     extraction_notes = Column(Text, nullable=True)  # Flags for manual review
 
     # Structured output (kept for observations tied to JD)
     relevance_summary = Column(Text, nullable=True)  # Factual summary
-    pros = Column(Text, default="[]")  # JSON: Factual observations tied to JD
-    cons = Column(Text, default="[]")  # JSON: Factual gaps relative to JD
+    pros = Column(JSONText, default="[]")  # JSON: Factual observations tied to JD
+    cons = Column(JSONText, default="[]")  # JSON: Factual gaps relative to JD
 
     # AI-generated content
-    suggested_questions = Column(Text, default="[]")  # JSON: Clarifying questions about facts
-    compliance_flags = Column(Text, default="[]")  # JSON: Legal/ethical concerns
+    suggested_questions = Column(JSONText, default="[]")  # JSON: Clarifying questions about facts
+    compliance_flags = Column(JSONText, default="[]")  # JSON: Legal/ethical concerns
 
     # Raw AI response
     raw_response = Column(Text, nullable=True)  # JSON: Full AI output for debugging
@@ -1,10 +1,11 @@
 """Application model for candidate applications."""
 
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float
-from sqlalchemy import func, UniqueConstraint
-from sqlalchemy.orm import relationship
+from sqlalchemy import func, Index, UniqueConstraint
+from sqlalchemy.orm import deferred, relationship
 
 from api.config.database import Base
+from api.models.types import JSONText
 
 
 class Application(Base):
@@ -52,16 +53,18 @@ class Application(Base):
     # Flags
     compliance_review = Column(Boolean, default=False)  # Flagged for review
 
-    # Artifacts (S3 keys) - stored as JSON string
+    # Artifacts (S3 keys) - stored as JSON text, loaded as a dict
     # {"resume": "s3://...", "analysis": "s3://...", "report": "s3://..."}
-    artifacts = Column(Text, default="{}")
+    artifacts = Column(JSONText, default="{}")
 
-    # Raw data from external provider (JSON string)
-    external_data = Column(Text, nullable=True)
+    # Raw data from external provider (JSON string). Deferred, like
+    # rejection_comment below: the API never reads either, so loading an
+    # Application doesn't pull these large text columns until accessed.
+    external_data = deferred(Column(Text, nullable=True))
 
     # Decision tracking (Human-in-the-Loop)
     rejection_reason_code = Column(String(50), nullable=True)
-    rejection_comment = Column(Text, nullable=True)
+    rejection_comment = deferred(Column(Text, nullable=True))
     rejected_by = Column(Integer, ForeignKey("recruiters.id", ondelete="SET NULL"), nullable=True)
     rejected_at = Column(DateTime, nullable=True)
     advanced_by = Column(Integer, ForeignKey("recruiters.id", ondelete="SET NULL"), nullable=True)
@@ -80,9 +83,34 @@ class Application(Base):
     updated_at = Column(DateTime, onupdate=func.getutcdate())
     processed_at = Column(DateTime, nullable=True)  # When fully processed
 
-    # Constraints
+    # Constraints and indexes
     __table_args__ = (
         UniqueConstraint("requisition_id", "external_application_id", name="uq_applications_req_ext"),
+        # Covering index for the list page (migration 00026)
+        Index(
+            "ix_applications_list",
+            requisition_id,
+            status,
+            created_at.desc(),
+            mssql_include=[
+                "external_application_id",
+                "candidate_name",
+                "candidate_email",
+                "workday_status",
+                "compliance_review",
+                "rejection_reason_code",
+                "jd_match_percentage",
+                "total_experience_months",
+                "avg_tenure_months",
+                "current_title",
+                "current_employer",
+                "months_since_last_employment",
+            ],
+        ),
+        # List page across all requisitions (migration 00027)
+        Index("ix_applications_status_created", status, created_at.desc()),
+        # Requisition list ranked by JD match (migration 00029)
+        Index("ix_applications_req_jd_match", requisition_id, jd_match_percentage.desc()),
     )
 
     # Relationships
@@ -1,6 +1,6 @@
 """Interview model for AI interview sessions."""
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Index
 from sqlalchemy import func
 from sqlalchemy.orm import relationship
 
@@ -51,6 +51,10 @@ class Interview(Base):
     # When the interview invite email was actually sent (NULL if link-only)
     invite_sent_at = Column(DateTime, nullable=True)
 
+    # Last failed invite send and SES's error (cleared by a successful send)
+    invite_failed_at = Column(DateTime, nullable=True)
+    invite_error = Column(String(500), nullable=True)
+
     # Timestamps
     created_at = Column(DateTime, default=func.getutcdate())
     started_at = Column(DateTime, nullable=True)
@@ -59,6 +63,11 @@ class Interview(Base):
     # Extra context
     extra_data = Column(Text, nullable=True)  # JSON
 
+    __table_args__ = (
+        # Per-application interview lookups by status (migration 00028)
+        Index("ix_interviews_application_status", application_id, status),
+    )
+
     # Relationships
     application = relationship("Application", back_populates="interviews")
     persona = relationship("Persona")
@@ -0,0 +1,60 @@
+"""Custom column types shared by the ORM models."""
+
+import re
+from typing import Any, Optional
+
+import orjson
+from sqlalchemy import Text
+from sqlalchemy.types import TypeDecorator
+
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    code = ord(match.group())
+    if code > 0xFFFF:
+        # Astral characters are written as a UTF-16 surrogate pair
+        code -= 0x10000
+        return "\\u%04x\\u%04x" % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u%04x" % code
+
+
+def json_dumps(value: Any) -> str:
+    """
+    Encode a value as compact, ASCII-only JSON text.
+
+    Text columns are VARCHAR on SQL Server, so non-ASCII characters are
+    written as \\u escapes (like the stdlib json default) to survive the
+    column's code page.
+    """
+    text = orjson.dumps(value).decode()
+    if text.isascii():
+        return text
+    return _NON_ASCII_RE.sub(_escape_non_ascii, text)
+
+
+class JSONText(TypeDecorator):
+    """
+    JSON document stored in a Text (VARCHAR(MAX)) column.
+
+    Values are decoded once when the row is loaded, so endpoints receive
+    dicts/lists instead of raw strings. Malformed JSON loads as None rather
+    than raising. On write, dicts/lists are encoded and strings are passed
+    through unchanged, since the processor already stores pre-encoded JSON.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        return json_dumps(value)
+
+    def process_result_value(self, value: Optional[str], dialect) -> Any:
+        if not value:
+            return None
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return None
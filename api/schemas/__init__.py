@@ -25,6 +25,8 @@ from .applications import (
     AnalysisResponse,
     ReprocessRequest,
     ReprocessResponse,
+    BulkReprocessRequest,
+    BulkReprocessResponse,
 )
 from .interviews import (
     InterviewCreate,
@@ -86,6 +88,8 @@ __all__ = [
     "AnalysisResponse",
     "ReprocessRequest",
     "ReprocessResponse",
+    "BulkReprocessRequest",
+    "BulkReprocessResponse",
     # Interviews
     "InterviewCreate",
     "InterviewListItem",
@@ -92,6 +92,32 @@ class ReprocessResponse(CamelModel):
     message: Optional[str] = None
 
 
+class BulkReprocessRequest(CamelModel):
+    """Request to reprocess several applications at once."""
+
+    application_ids: List[int]
+    from_step: str = "analyze"  # analyze, send_interview, evaluate, generate_report
+
+    @field_validator("application_ids")
+    @classmethod
+    def validate_application_ids(cls, v: List[int]) -> List[int]:
+        if not v:
+            raise ValueError("At least one application ID is required")
+        if len(v) > 500:
+            raise ValueError("At most 500 applications can be reprocessed at once")
+        # De-duplicate, keeping request order
+        return list(dict.fromkeys(v))
+
+
+class BulkReprocessResponse(CamelModel):
+    """Response for bulk reprocess request."""
+
+    status: str
+    queue_item_ids: List[int] = []
+    not_found_ids: List[int] = []
+    message: Optional[str] = None
+
+
 # Human-in-the-Loop Decision Schemas
 
 class AdvanceRequest(CamelModel):
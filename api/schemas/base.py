@@ -1,8 +1,9 @@
 """Base Pydantic schemas with CamelCase conversion."""
 
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 
-from pydantic import BaseModel, ConfigDict
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from humps import camelize
 
 
@@ -38,6 +39,7 @@ class PaginationMeta(CamelModel):
     per_page: int
     total: int
     total_pages: int
+    next_cursor: Optional[str] = None  # Keyset cursor for the next page, where supported
 
 
 class PaginatedResponse(CamelModel, Generic[T]):
@@ -67,3 +69,22 @@ class ErrorResponse(CamelModel):
     """Standard error response format."""
 
     error: ErrorDetail
+
+
+# Serializes models (or lists of models) by their runtime type
+_ANY_ADAPTER = TypeAdapter(Any)
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """
+    Serialize already-validated models straight to a JSON response.
+
+    Returning a Response makes FastAPI skip re-validating the result against
+    the route's response_model (which still documents the schema in OpenAPI).
+    Output matches the normal path: camelCase aliases, pydantic JSON encoding.
+    """
+    return Response(
+        content=_ANY_ADAPTER.dump_json(content, by_alias=True),
+        media_type="application/json",
+        status_code=status_code,
+    )
@@ -40,6 +40,9 @@ class InterviewResponse(CamelModel):
     token: Optional[str] = None
     token_expires_at: Optional[datetime] = None
     persona_id: Optional[int] = None
+    invite_sent_at: Optional[datetime] = None
+    invite_failed_at: Optional[datetime] = None
+    invite_error: Optional[str] = None
     created_at: datetime
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -163,7 +166,11 @@ class ActivateInterviewResponse(CamelModel):
     interview_id: int
     interview_url: str
     expires_at: datetime
+    # Deprecated: same as email_queued. The email goes out after the
+    # response, so this no longer confirms delivery; the interview's
+    # invite_sent_at/invite_failed_at record the outcome.
     email_sent: bool
+    email_queued: bool = False
     email_sent_to: Optional[str] = None
 
 
@@ -2,7 +2,8 @@
 
 from .token import create_token, decode_token, should_refresh_token
 from .sso_token import validate_sso_token
-from .rbac import require_role, require_admin, get_current_user
+from .rbac import require_role, require_admin, require_recruiter, get_current_user
+from .cache import TTLCache
 
 __all__ = [
     "create_token",
@@ -11,5 +12,7 @@ __all__ = [
     "validate_sso_token",
     "require_role",
     "require_admin",
+    "require_recruiter",
     "get_current_user",
+    "TTLCache",
 ]
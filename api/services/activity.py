@@ -0,0 +1,25 @@
+"""Deferred writes of Activity audit rows."""
+
+import structlog
+from sqlalchemy import insert
+
+from api.config.database import SessionLocal
+from api.models import Activity
+
+logger = structlog.get_logger()
+
+
+def write_activity(**values) -> None:
+    """
+    Insert one Activity row in its own session.
+
+    Run as a FastAPI background task, after the response is sent, so the
+    audit row isn't part of the request's transaction. Failures are logged
+    rather than raised since the decision itself has already committed.
+    """
+    try:
+        with SessionLocal() as db:
+            db.execute(insert(Activity).values(**values))
+            db.commit()
+    except Exception as e:
+        logger.error("Failed to write activity", action=values.get("action"), error=str(e))
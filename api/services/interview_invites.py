@@ -0,0 +1,64 @@
+"""Deferred sending of interview invite emails."""
+
+import asyncio
+from typing import Optional
+
+import structlog
+from sqlalchemy import func, update
+
+from api.config.database import SessionLocal
+from api.integrations.ses import get_ses_service
+from api.models import Interview
+
+logger = structlog.get_logger()
+
+# Longest SES error message kept on the interview (interviews.invite_error)
+INVITE_ERROR_MAX_LENGTH = 500
+
+
+def _record_invite_result(interview_id: int, error: Optional[str]) -> None:
+    """Store the outcome of an invite send on the interview row."""
+    if error is None:
+        values = {"invite_sent_at": func.getutcdate(), "invite_failed_at": None, "invite_error": None}
+    else:
+        values = {"invite_failed_at": func.getutcdate(), "invite_error": error[:INVITE_ERROR_MAX_LENGTH]}
+    with SessionLocal() as db:
+        db.execute(update(Interview).where(Interview.id == interview_id).values(**values))
+        db.commit()
+
+
+async def send_interview_invite(
+    interview_id: int,
+    from_email: Optional[str],
+    from_name: Optional[str],
+    custom: bool,
+    send_kwargs: dict,
+) -> None:
+    """
+    Send an interview invite via SES and record the result on the interview.
+
+    Run as a FastAPI background task after the interview has committed.
+    Retries are left to the SES client (adaptive retry mode), so each call
+    makes one send. On success invite_sent_at is set; on failure
+    invite_failed_at/invite_error are set so the recruiter can see it and
+    send a new invite from the application.
+    """
+    log = logger.bind(interview_id=interview_id)
+    ses = get_ses_service(from_email, from_name)
+    try:
+        if custom:
+            await ses.send_email(**send_kwargs)
+        else:
+            await ses.send_interview_invite(**send_kwargs)
+    except Exception as e:
+        log.error("Failed to send interview email", error=str(e))
+        error = str(e) or type(e).__name__
+    else:
+        log.info("Interview email sent", to=send_kwargs["to"], custom_email=custom)
+        error = None
+
+    # The DB driver is blocking; keep it off the event loop
+    try:
+        await asyncio.to_thread(_record_invite_result, interview_id, error)
+    except Exception as e:
+        log.error("Failed to record interview email result", error=str(e))
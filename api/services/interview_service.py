@@ -5,11 +5,12 @@ This service contains the core interview logic that is shared between:
 - Proxy interviews (recruiter conducting on candidate's behalf)
 """
 
-import json
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 
+import orjson
 import structlog
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from api.models import Interview, Message, Application, Requisition, Persona, Analysis, CandidateProfile
@@ -57,7 +58,7 @@ class InterviewService:
 
         # Update status and save greeting in single transaction
         interview.status = "in_progress"
-        interview.started_at = datetime.now(timezone.utc)
+        interview.started_at = func.getutcdate()  # DB clock, set by the UPDATE
 
         message = Message(
             interview_id=interview_id,
@@ -280,8 +281,8 @@ Examples:
         if isinstance(data, list):
             return data
         try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(data)
+        except (orjson.JSONDecodeError, TypeError):
             return []
 
     def _format_analysis_context(self, analysis: Analysis) -> str:
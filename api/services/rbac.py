@@ -1,5 +1,6 @@
 """Role-based access control for API endpoints."""
 
+from functools import lru_cache
 from typing import Any, Callable
 
 from fastapi import Depends, HTTPException, Request
@@ -101,12 +102,24 @@ def require_role(allowed_roles: list[str]) -> Callable:
     """
     Dependency that requires user to have one of the specified roles.
 
+    The same role list always returns the same checker, so FastAPI's
+    per-request dependency cache runs it once even when several
+    dependencies of an endpoint require it.
+
     Usage:
         @router.post("/admin-only")
         def admin_endpoint(user: dict = Depends(require_role(["admin"]))):
             return {"message": "Admin access granted"}
     """
-    def check_role(request: Request) -> dict[str, Any]:
+    return _role_checker(tuple(allowed_roles))
+
+
+@lru_cache(maxsize=None)
+def _role_checker(allowed_roles: tuple[str, ...]) -> Callable:
+    """Build (once per role list) the dependency behind require_role."""
+    # async: the check does no I/O, so it runs on the event loop instead of
+    # taking a threadpool hop per request
+    async def check_role(request: Request) -> dict[str, Any]:
         user = get_current_user(request)
         user_roles = user.get("roles", [])
 
@@ -115,7 +128,7 @@ def require_role(allowed_roles: list[str]) -> Callable:
                 logger.debug(
                     "Role check passed",
                     user=user.get("sub"),
-                    required=allowed_roles,
+                    required=list(allowed_roles),
                     user_role=get_user_role(user_roles),
                 )
                 return user
@@ -123,7 +136,7 @@ def require_role(allowed_roles: list[str]) -> Callable:
         logger.warning(
             "Role check failed",
             user=user.get("sub"),
-            required=allowed_roles,
+            required=list(allowed_roles),
             user_roles=user_roles,
         )
         raise HTTPException(
@@ -134,7 +147,7 @@ def require_role(allowed_roles: list[str]) -> Callable:
     return check_role
 
 
-def require_admin(request: Request) -> dict[str, Any]:
+async def require_admin(request: Request) -> dict[str, Any]:
     """
     Dependency that requires admin role.
 
@@ -143,4 +156,8 @@ def require_admin(request: Request) -> dict[str, Any]:
         def delete_all(user: dict = Depends(require_admin)):
             ...
     """
-    return require_role(["admin"])(request)
+    return await require_role(["admin"])(request)
+
+
+# Shared checker for endpoints open to admins and recruiters
+require_recruiter = require_role(["admin", "recruiter"])
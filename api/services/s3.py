@@ -1,5 +1,7 @@
 """S3 service for presigned URL generation."""
 
+from functools import lru_cache
+
 import boto3
 import structlog
 from botocore.exceptions import ClientError
@@ -21,7 +23,7 @@ class S3Service:
         self.client = boto3.client("s3", **client_kwargs)
         self.bucket = settings.S3_BUCKET
 
-    async def get_presigned_url(
+    def get_presigned_url(
         self,
         key: str,
         expires_in: int = 3600,
@@ -29,6 +31,9 @@ class S3Service:
     ) -> str:
         """Generate a presigned URL for download.
 
+        Signing is done locally (no request to S3), so this is a plain
+        method callable from threadpool endpoints.
+
         Args:
             key: Full S3 key
             expires_in: URL validity in seconds
@@ -72,6 +77,18 @@ class S3Service:
             raise S3Error(f"Existence check failed: {str(e)}") from e
 
 
+@lru_cache
+def get_s3_service() -> S3Service:
+    """
+    Get the shared S3Service.
+
+    boto3 clients are thread-safe, and building one (credential chain,
+    endpoint resolution) costs far more than signing a URL, so one client
+    is reused for the life of the process.
+    """
+    return S3Service()
+
+
 class S3Error(Exception):
     """Raised when S3 operations fail."""
 
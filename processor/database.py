@@ -16,12 +16,16 @@ if "MARS_Connection" not in database_url:
     database_url = f"{database_url}{separator}MARS_Connection=Yes"
 
 # Create engine with SQL Server specific settings
+# The pool holds a connection for every concurrent job, so parallel jobs
+# don't open and close overflow connections on each checkout. Pre-ping stays
+# on: the worker can sit idle long enough for connections to go stale.
 engine = create_engine(
     database_url,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    pool_recycle=3600,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,6 +1,8 @@
 """SES integration for sending emails."""
 
+import asyncio
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -18,6 +20,15 @@ logger = structlog.get_logger()
 TEMPLATE_DIR = Path(__file__).parent.parent.parent / "api" / "config" / "templates"
 
 
+@lru_cache
+def _read_template(name: str) -> str:
+    """Read a template file once per process; templates ship with the image."""
+    template_path = TEMPLATE_DIR / name
+    if not template_path.exists():
+        raise FileNotFoundError(f"Template not found: {template_path}")
+    return template_path.read_text(encoding="utf-8")
+
+
 class SESService:
     """Service for sending emails via AWS SES."""
 
@@ -91,7 +102,8 @@ class SESService:
             if reply_to:
                 params["ReplyToAddresses"] = [reply_to]
 
-            response = self.client.send_email(**params)
+            # boto3 is blocking; run the HTTPS call off the event loop
+            response = await asyncio.to_thread(self.client.send_email, **params)
 
             message_id = response["MessageId"]
 
@@ -117,10 +129,7 @@ class SESService:
         Returns:
             Template content as string
         """
-        template_path = TEMPLATE_DIR / name
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
-        return template_path.read_text(encoding="utf-8")
+        return _read_template(name)
 
     def _render_template(self, template: str, **kwargs) -> str:
         """Render a template with variable substitution.
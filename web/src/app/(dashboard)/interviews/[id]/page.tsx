@@ -208,6 +208,22 @@ export default function InterviewDetailPage() {
                 <span className="text-muted-foreground">Created</span>
                 <span>{formatDateTime(interview.createdAt)}</span>
               </div>
+              {interview.inviteSentAt && (
+                <div className="flex justify-between">
+                  <span className="text-muted-foreground">Invite Sent</span>
+                  <span>{formatDateTime(interview.inviteSentAt)}</span>
+                </div>
+              )}
+              {interview.inviteFailedAt && (
+                <div className="flex items-start gap-2 text-red-600">
+                  <AlertCircle className="h-4 w-4 mt-0.5 flex-shrink-0" />
+                  <span>
+                    Invite email failed {formatDateTime(interview.inviteFailedAt)}
+                    {interview.inviteError && `: ${interview.inviteError}`}. Send a new
+                    invite from the application.
+                  </span>
+                </div>
+              )}
               {interview.startedAt && (
                 <div className="flex justify-between">
                   <span className="text-muted-foreground">Started</span>
@@ -73,7 +73,8 @@ export default function DefaultsSettingsPage() {
         <div>
           <h1 className="text-2xl font-bold">Requisition Defaults</h1>
           <p className="text-muted-foreground">
-            Global settings that apply when requisition-specific settings are not configured
+            Global settings that apply when requisition-specific settings are not configured.
+            Saved changes reach every server within a few seconds.
           </p>
         </div>
         <Button
@@ -21,7 +21,9 @@ interface SendInterviewResponse {
   interviewId: number;
   interviewUrl: string;
   expiresAt: string;
+  /** @deprecated Same as emailQueued; the email is sent after the response */
   emailSent: boolean;
+  emailQueued: boolean;
   emailSentTo: string | null;
 }
 
@@ -215,9 +217,9 @@ export function SendInterviewModal({
                 <CheckCircle className="h-5 w-5 text-green-600 flex-shrink-0" />
                 <div>
                   <div className="font-medium text-green-800 dark:text-green-200">
-                    {result.emailSent ? 'Email sent!' : (copied ? 'Link copied!' : 'Link ready!')}
+                    {result.emailQueued ? 'Email queued!' : (copied ? 'Link copied!' : 'Link ready!')}
                   </div>
-                  {result.emailSent && result.emailSentTo && (
+                  {result.emailQueued && result.emailSentTo && (
                     <div className="text-sm text-green-700 dark:text-green-300">
                       {result.emailSentTo}
                     </div>
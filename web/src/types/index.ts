@@ -5,6 +5,7 @@ export interface PaginationMeta {
   perPage: number;
   total: number;
   totalPages: number;
+  nextCursor?: string | null;  // Keyset cursor for the next page (applications list)
 }
 
 export interface PaginatedResponse<T> {
@@ -91,6 +92,9 @@ export interface Interview {
   humanRequested: boolean;
   humanRequestedAt: string | null;
   personaId: number | null;
+  inviteSentAt: string | null;
+  inviteFailedAt: string | null;
+  inviteError: string | null;
   messageCount: number;
   createdAt: string;
 }